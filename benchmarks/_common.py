@@ -0,0 +1,59 @@
+"""Helpers shared by the benchmark scripts."""
+
+import os
+import statistics
+import sys
+import time
+from typing import Callable, NamedTuple
+
+PROJ_ROOT_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), os.pardir
+)
+if PROJ_ROOT_PATH not in sys.path:
+    sys.path.append(PROJ_ROOT_PATH)
+
+
+class Result(NamedTuple):
+    """A single benchmark measurement."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+class FakeClock:
+    """Virtual monotonic clock; `sleep` advances it instantly.
+
+    Pass `clock.monotonic` and `clock.sleep` as the `clock` and `sleep`
+    arguments of `poll` so that sleeping costs nothing and only the loop
+    overhead is measured.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += max(seconds, 0)
+
+
+def best_of(
+    fun: Callable[[], float], repeat: int = 5, higher_is_better: bool = False
+) -> float:
+    """Best of `repeat` runs, the most stable estimate of the cost."""
+    return (max if higher_is_better else min)(fun() for _ in range(repeat))
+
+
+def median_of(fun: Callable[[], float], repeat: int = 5) -> float:
+    return statistics.median([fun() for _ in range(repeat)])
+
+
+def per_call(fun: Callable[[], object], number: int) -> float:
+    """Seconds per call of `fun` over `number` calls."""
+    start = time.perf_counter()
+    for _ in range(number):
+        fun()
+    return (time.perf_counter() - start) / number
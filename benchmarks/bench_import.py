@@ -0,0 +1,78 @@
+"""Import time of the package, measured in fresh interpreters.
+
+Cold starts of the Lambda layer pay this cost on every new execution
+environment. Besides the time, the number of modules each import loads is
+reported: it does not vary between runs, so `run.py --compare` catches a
+heavy dependency slipping back into the import path even on noisy machines.
+
+python benchmarks/bench_import.py
+"""
+
+import subprocess
+import sys
+from typing import List
+
+from _common import PROJ_ROOT_PATH, Result, median_of
+
+MODULES = ("topshelfsoftware_polling", "topshelfsoftware_polling.polling")
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time (in sec) of `module` reported by
+    `python -X importtime`, excluding interpreter start-up."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJ_ROOT_PATH,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            total_us = int(fields[1])
+    return total_us / 1e6
+
+
+def modules_loaded(module: str) -> int:
+    """Number of modules newly loaded by importing `module`."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; n = len(sys.modules); import {module}; "
+            f"print(len(sys.modules) - n)",
+        ],
+        cwd=PROJ_ROOT_PATH,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(proc.stdout)
+
+
+def run() -> List[Result]:
+    results = []
+    for module in MODULES:
+        results.append(
+            Result(
+                f"import.{module}",
+                median_of(lambda: import_time(module)) * 1e3,
+                "ms",
+            )
+        )
+        results.append(
+            Result(
+                f"import.{module}.module_count",
+                modules_loaded(module),
+                "modules",
+            )
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"{result.name:<50} {result.value:>12.2f} {result.unit}")
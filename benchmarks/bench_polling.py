@@ -0,0 +1,157 @@
+"""Per-attempt overhead of the polling loop and throughput of many
+concurrent polls.
+
+    python benchmarks/bench_polling.py
+"""
+
+import asyncio
+import time
+from typing import List
+
+from _common import FakeClock, Result, best_of
+
+from topshelfsoftware_polling.exceptions import PollAttemptLimitReached
+from topshelfsoftware_polling.polling import poll, poll_async
+from topshelfsoftware_polling.schedule import Exponential
+from topshelfsoftware_polling.scheduler import PollScheduler
+from topshelfsoftware_polling.step import (
+    step_constant,
+    step_exponential_backoff,
+)
+
+ATTEMPTS = 2_000
+CONCURRENT_POLLS = 1_000
+CONCURRENT_ATTEMPTS = 5
+
+
+def _falsy():
+    return None
+
+
+def attempt_overhead(**poll_kwargs) -> float:
+    """Seconds of loop overhead per attempt of a zero-cost target, with
+    sleeping replaced by a virtual clock."""
+
+    def run() -> float:
+        clock = FakeClock()
+        start = time.perf_counter()
+        try:
+            poll(
+                _falsy,
+                timeout=None,
+                max_attempts=ATTEMPTS,
+                log=False,
+                clock=clock.monotonic,
+                sleep=clock.sleep,
+                **poll_kwargs,
+            )
+        except PollAttemptLimitReached:
+            pass
+        return (time.perf_counter() - start) / ATTEMPTS
+
+    return best_of(run)
+
+
+def _countdown_target(attempts: int):
+    """Target that succeeds on its `attempts`-th call for each key."""
+    counts = {}
+
+    def target(key):
+        counts[key] = counts.get(key, 0) + 1
+        return counts[key] >= attempts
+
+    return target
+
+
+def async_throughput() -> float:
+    """Attempts per second of many `poll_async` calls on one event loop."""
+
+    async def main():
+        target = _countdown_target(CONCURRENT_ATTEMPTS)
+        await asyncio.gather(
+            *(
+                poll_async(
+                    target,
+                    args=(i,),
+                    step_fun=step_constant,
+                    step_fun_kwargs={"step": 0},
+                    timeout=None,
+                    log=False,
+                )
+                for i in range(CONCURRENT_POLLS)
+            )
+        )
+
+    def run() -> float:
+        start = time.perf_counter()
+        asyncio.run(main())
+        elapsed = time.perf_counter() - start
+        return CONCURRENT_POLLS * CONCURRENT_ATTEMPTS / elapsed
+
+    return best_of(run, repeat=3, higher_is_better=True)
+
+
+def scheduler_throughput() -> float:
+    """Attempts per second of many polls submitted to a `PollScheduler`."""
+
+    def run() -> float:
+        target = _countdown_target(CONCURRENT_ATTEMPTS)
+        start = time.perf_counter()
+        with PollScheduler() as scheduler:
+            futures = [
+                scheduler.submit(
+                    target,
+                    args=(i,),
+                    step_fun=step_constant,
+                    step_fun_kwargs={"step": 0},
+                    timeout=None,
+                    log=False,
+                )
+                for i in range(CONCURRENT_POLLS)
+            ]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - start
+        return CONCURRENT_POLLS * CONCURRENT_ATTEMPTS / elapsed
+
+    return best_of(run, repeat=3, higher_is_better=True)
+
+
+def run() -> List[Result]:
+    return [
+        Result(
+            "poll.attempt_overhead.step_constant",
+            attempt_overhead(
+                step_fun=step_constant, step_fun_kwargs={"step": 1}
+            )
+            * 1e6,
+            "us",
+        ),
+        Result(
+            "poll.attempt_overhead.step_exponential_backoff",
+            attempt_overhead(step_fun=step_exponential_backoff) * 1e6,
+            "us",
+        ),
+        Result(
+            "poll.attempt_overhead.schedule_exponential",
+            attempt_overhead(step_fun=Exponential()) * 1e6,
+            "us",
+        ),
+        Result(
+            "poll_async.throughput",
+            async_throughput(),
+            "attempts/s",
+            higher_is_better=True,
+        ),
+        Result(
+            "scheduler.throughput",
+            scheduler_throughput(),
+            "attempts/s",
+            higher_is_better=True,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"{result.name:<50} {result.value:>12.2f} {result.unit}")
@@ -0,0 +1,123 @@
+"""Compare memory and CPU of concurrent polls: one thread per `poll()` call
+versus a single `PollScheduler`.
+
+Each mode runs in a fresh subprocess so peak RSS is measured in isolation.
+
+    python benchmarks/bench_scheduler.py [--polls 10000] [--attempts 3]
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+import _common  # noqa: F401 - need _common for sys path imports to work
+
+from topshelfsoftware_polling.polling import poll
+from topshelfsoftware_polling.scheduler import PollScheduler
+from topshelfsoftware_polling.step import step_constant
+
+MODES = ("threads", "scheduler")
+
+
+def make_target(attempts: int):
+    """Target that succeeds on its `attempts`-th call for each key."""
+    counts = {}
+    lock = threading.Lock()
+
+    def target(key):
+        with lock:
+            counts[key] = counts.get(key, 0) + 1
+            return counts[key] >= attempts
+
+    return target
+
+
+def run_threads(polls: int, attempts: int, step: float):
+    target = make_target(attempts)
+    threads = [
+        threading.Thread(
+            target=poll,
+            args=(target,),
+            kwargs={
+                "args": (i,),
+                "step_fun": step_constant,
+                "step_fun_kwargs": {"step": step},
+                "timeout": None,
+            },
+        )
+        for i in range(polls)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_scheduler(polls: int, attempts: int, step: float):
+    target = make_target(attempts)
+    with PollScheduler(max_workers=4) as scheduler:
+        futures = [
+            scheduler.submit(
+                target,
+                args=(i,),
+                step_fun=step_constant,
+                step_fun_kwargs={"step": step},
+                timeout=None,
+            )
+            for i in range(polls)
+        ]
+        for future in futures:
+            future.result()
+
+
+def measure(mode: str, polls: int, attempts: int, step: float):
+    """Run one mode in this process and print a result line."""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    if mode == "threads":
+        run_threads(polls, attempts, step)
+    else:
+        run_scheduler(polls, attempts, step)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{wall:.3f} {cpu:.3f} {max(rss_after - rss_before, 0)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=10_000)
+    parser.add_argument("--attempts", type=int, default=3)
+    parser.add_argument("--step", type=float, default=0.5)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        measure(args.mode, args.polls, args.attempts, args.step)
+        return
+
+    print(
+        f"{args.polls} concurrent polls, {args.attempts} attempts each, "
+        f"{args.step}s step"
+    )
+    print(f"{'mode':<10} {'wall s':>8} {'cpu s':>8} {'peak rss KiB':>13}")
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode]
+            + ["--polls", str(args.polls)]
+            + ["--attempts", str(args.attempts)]
+            + ["--step", str(args.step)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        wall, cpu, rss = float(out[0]), float(out[1]), int(out[2])
+        print(f"{mode:<10} {wall:>8.3f} {cpu:>8.3f} {rss:>13}")
+
+
+if __name__ == "__main__":
+    main()
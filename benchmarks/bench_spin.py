@@ -0,0 +1,69 @@
+"""Detection latency and CPU use of `poll_spin` and `poll` for a cheap
+local condition that becomes true after a short delay.
+
+    python benchmarks/bench_spin.py
+"""
+
+import statistics
+import time
+from typing import Callable, List, Tuple
+
+from _common import Result
+
+from topshelfsoftware_polling.polling import poll
+from topshelfsoftware_polling.spin import poll_spin
+
+# delays (in sec) after which the condition becomes true: within the spin,
+# within the yield and within the sleeping phase of `poll_spin`
+READY_AFTER = (0.0001, 0.001, 0.02)
+RUNS = 25
+
+POLLERS = {
+    "poll": lambda target: poll(
+        target,
+        step_fun_kwargs={"base_interval": 0.001, "max_interval": 0.05},
+        timeout=None,
+        log=False,
+    ),
+    "poll_spin": lambda target: poll_spin(target, timeout=None),
+}
+
+
+def detect(poller: Callable, ready_after: float) -> Tuple[float, float]:
+    """Detection latency and CPU time (in sec) of one poll of a condition
+    becoming true after `ready_after` seconds."""
+    ready_at = time.perf_counter() + ready_after
+
+    def target() -> bool:
+        return time.perf_counter() >= ready_at
+
+    cpu_start = time.process_time()
+    poller(target)
+    latency = time.perf_counter() - ready_at
+    return latency, time.process_time() - cpu_start
+
+
+def run() -> List[Result]:
+    results = []
+    for name, poller in POLLERS.items():
+        for ready_after in READY_AFTER:
+            runs = [detect(poller, ready_after) for _ in range(RUNS)]
+            latencies, cpu_times = zip(*runs)
+            wall = sum(latencies) + ready_after * RUNS
+            case = f"spin.{name}.ready_after_{ready_after * 1e3:g}ms"
+            results.append(
+                Result(
+                    f"{case}.latency",
+                    statistics.median(latencies) * 1e6,
+                    "us",
+                )
+            )
+            results.append(
+                Result(f"{case}.cpu", sum(cpu_times) / wall * 100, "%")
+            )
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"{result.name:<50} {result.value:>12.2f} {result.unit}")
@@ -0,0 +1,40 @@
+"""Cost of each step function in `topshelfsoftware_polling.step`.
+
+python benchmarks/bench_step.py
+"""
+
+from typing import List
+
+from _common import Result, best_of, per_call
+
+from topshelfsoftware_polling.step import (
+    step_constant,
+    step_exponential_backoff,
+)
+
+NUMBER = 100_000
+
+
+def run() -> List[Result]:
+    cases = {
+        "step_constant": lambda: step_constant(step=1, attempt=5),
+        "step_exponential_backoff": lambda: step_exponential_backoff(
+            attempt=5
+        ),
+        "step_exponential_backoff.jitter": lambda: step_exponential_backoff(
+            attempt=5, jitter=True
+        ),
+    }
+    return [
+        Result(
+            f"step.{name}",
+            best_of(lambda: per_call(fun, NUMBER)) * 1e9,
+            "ns",
+        )
+        for name, fun in cases.items()
+    ]
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(f"{result.name:<50} {result.value:>12.2f} {result.unit}")
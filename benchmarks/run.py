@@ -0,0 +1,78 @@
+"""Run the benchmark suite and optionally compare against a saved baseline.
+
+    python benchmarks/run.py [--save FILE] [--compare FILE] [--tolerance 0.25]
+
+`--compare` exits with status 1 if any benchmark is worse than the baseline
+by more than the tolerance, so a baseline saved from the last release can
+guard against regressions. Baselines are machine specific; compare results
+from the same machine only.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+import bench_import
+import bench_polling
+import bench_spin
+import bench_step
+from _common import Result
+
+SUITES = (bench_polling, bench_step, bench_spin, bench_import)
+
+
+def regressions(
+    results: List[Result], baseline: Dict[str, float], tolerance: float
+) -> List[str]:
+    """Describe each result that is worse than its baseline value."""
+    found = []
+    for result in results:
+        base = baseline.get(result.name)
+        if not base:
+            continue
+        change = (result.value - base) / base
+        if result.higher_is_better:
+            change = -change
+        if change > tolerance:
+            found.append(
+                f"{result.name}: {result.value:.2f} {result.unit} vs "
+                f"{base:.2f} {result.unit} baseline ({change:+.0%} worse)"
+            )
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", metavar="FILE", help="write results")
+    parser.add_argument("--compare", metavar="FILE", help="baseline results")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown before failing (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    results = []
+    for suite in SUITES:
+        for result in suite.run():
+            print(f"{result.name:<50} {result.value:>12.2f} {result.unit}")
+            results.append(result)
+
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump({r.name: r.value for r in results}, fp, indent=4)
+
+    if args.compare:
+        with open(args.compare, "r") as fp:
+            baseline = json.load(fp)
+        found = regressions(results, baseline, args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ import json
 import os
 import shutil
 import sys
-from typing import Generator
+from typing import Generator, Optional
 
 import pytest
 import yaml
@@ -85,3 +85,48 @@ def print_section_break(char: str = "-") -> str:
     terminal_width = shutil.get_terminal_size().columns
     section_break_str = char * terminal_width
     print(section_break_str)
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class VirtualClock:
+    """Clock in virtual time: sleeping advances it at once and records the
+    requested delay in `sleeps`."""
+
+    def __init__(self, wall_start: float = 0.0):
+        self.now = 0.0
+        self.sleeps = []
+        self.wall_start = wall_start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        """Wall clock time, `wall_start` at virtual time `0`."""
+        return self.wall_start + self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def sleep_async(self, seconds: float):
+        self.sleep(seconds)
+
+
+class FakeLambdaContext:
+    """Stand-in for the AWS Lambda context object. The remaining time is
+    fixed, or counts down with `clock` if one is given."""
+
+    def __init__(
+        self, remaining_ms: int, clock: Optional[VirtualClock] = None
+    ):
+        self.remaining_ms = remaining_ms
+        self.clock = clock
+        if clock is not None:
+            self.end = clock.now + remaining_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        if self.clock is None:
+            return self.remaining_ms
+        return int((self.end - self.clock.now) * 1000)
@@ -1,5 +1,6 @@
 import logging
 import os
+import subprocess
 import sys
 
 import pytest
@@ -11,7 +12,7 @@ from conftest import get_json_files, print_section_break
 # ----------------------------------------------------------------------------#
 #                               --- Globals ---                               #
 # ----------------------------------------------------------------------------#
-from __setup__ import TEST_EVENTS_PATH
+from __setup__ import PROJ_ROOT_PATH, TEST_EVENTS_PATH
 
 MODULE = "__init__"
 MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
@@ -47,3 +48,34 @@ def test_01_debug(get_event_as_dict):
     assert all(
         pkg_logger.level == logging.DEBUG for pkg_logger in pkg_loggers
     ), f"Not all loggers are at the {logging.DEBUG} level"
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["import", "success"])
+)
+def test_02_import(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    not_imported = expected_output["not_imported"]
+    for module in _input["modules"]:
+        # a fresh interpreter, since the test session already imported all
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys, {module}; "
+                f"print(*[m for m in {not_imported!r} if m in sys.modules])",
+            ],
+            cwd=PROJ_ROOT_PATH,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        loaded = proc.stdout.split()
+        logger.info(f"{module} loaded: {loaded}")
+        assert not loaded, f"Importing {module} loaded {loaded}"
@@ -0,0 +1,94 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "adaptive"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.adaptive import AdaptiveStep  # noqa: E402
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["adaptive", "success"])
+)
+def test_01_adaptive_step(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    adaptive = AdaptiveStep(**_input["adaptive_kwargs"])
+    step = adaptive.for_key("job")
+    calls_per_poll = []
+    for _ in range(_input["polls"]):
+        clock = VirtualClock()
+        calls = []
+
+        def target():
+            calls.append(clock.now)
+            return clock.now >= _input["ready_time"]
+
+        poll(
+            target,
+            step_fun=step,
+            hooks=step,
+            timeout=_input["timeout"],
+            clock=clock.monotonic,
+            sleep=clock.sleep,
+        )
+        calls_per_poll.append(len(calls))
+    logger.info(f"Calls per poll: {calls_per_poll}")
+    assert calls_per_poll[0] == expected_output["first_poll_calls"]
+    assert calls_per_poll[-1] <= expected_output["max_last_poll_calls"]
+    low, high = expected_output["estimate_range"]
+    assert low <= adaptive.estimate("job") <= high
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["adaptive", "persisted"])
+)
+def test_02_adaptive_bounded_persisted(get_event_as_dict, tmp_path):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    path = str(tmp_path / "estimates.json")
+    adaptive = AdaptiveStep(max_keys=_input["max_keys"], path=path)
+    for key, elapsed in _input["observations"]:
+        adaptive.observe(key, elapsed)
+    assert len(adaptive) == _input["max_keys"]
+
+    reloaded = AdaptiveStep(max_keys=_input["max_keys"], path=path)
+    estimates = {
+        key: reloaded.estimate(key) for key, _ in _input["observations"]
+    }
+    assert {k: v for k, v in estimates.items() if v is not None} == (
+        expected_output["estimates"]
+    )
@@ -0,0 +1,173 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "batch"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.batch import (  # noqa: E402
+    poll_batch,
+    poll_batch_iter,
+)
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollTimeLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.hooks import PollHooks  # noqa: E402
+from topshelfsoftware_polling.stats import PollStats  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class BulkStatusApi:
+    """Bulk status function: key `k` is done once `k % ready_every`
+    seconds have passed."""
+
+    def __init__(
+        self, clock: VirtualClock, ready_every: int, fail_calls: tuple = ()
+    ):
+        self.clock = clock
+        self.ready_every = ready_every
+        self.fail_calls = fail_calls
+        self.chunk_sizes = []
+
+    def describe(self, keys: list) -> dict:
+        if int(self.clock.now) == len(self.chunk_sizes):
+            self.chunk_sizes.append([])
+        self.chunk_sizes[-1].append(len(keys))
+        if sum(map(len, self.chunk_sizes)) in self.fail_calls:
+            raise ConnectionError("bulk status API unavailable")
+        return {
+            key: "DONE" if self.clock.now >= key % self.ready_every else "RUN"
+            for key in keys
+        }
+
+
+class RecordResponses(PollHooks):
+    def __init__(self):
+        self.retry_responses = []
+        self.success_response = None
+
+    def on_retry(self, record):
+        self.retry_responses.append(_str_keys(record.response))
+
+    def on_success(self, record):
+        self.success_response = _str_keys(record.response)
+
+
+def _str_keys(responses: dict) -> dict:
+    """Responses with string keys, as in the JSON events."""
+    return {str(key): res for key, res in responses.items()}
+
+
+def _poll_kwargs(_input: dict, clock: VirtualClock) -> dict:
+    poll_kwargs = dict(_input["poll_kwargs"])
+    for name in ("step_fun", "check_success", "ignore_exceptions"):
+        if name in poll_kwargs:
+            poll_kwargs[name] = eval(poll_kwargs[name])
+    return {**poll_kwargs, "clock": clock.monotonic, "sleep": clock.sleep}
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["batch", "success"])
+)
+def test_01_poll_batch(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    api = BulkStatusApi(
+        clock, _input["ready_every"], _input.get("fail_calls", [])
+    )
+    keys = range(_input["keys"])
+    results = poll_batch(api.describe, keys, **_poll_kwargs(_input, clock))
+    logger.info(f"Calls per attempt: {api.chunk_sizes}")
+    assert results == {key: "DONE" for key in keys}
+    assert list(results)[:3] == expected_output["first_keys"]
+    assert api.chunk_sizes == expected_output["chunk_sizes"]
+    assert clock.sleeps == expected_output["sleeps"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["batch", "error"])
+)
+def test_02_poll_batch_iter_error(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    api = BulkStatusApi(clock, _input["ready_every"])
+    completed = []
+    with pytest.raises(eval(expected_output["exception"])):
+        for key, _ in poll_batch_iter(
+            api.describe,
+            range(_input["keys"]),
+            **_poll_kwargs(_input, clock),
+        ):
+            completed.append(key)
+    assert completed == expected_output["completed"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["batch", "hooks"])
+)
+def test_03_poll_batch_iter_hooks(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    api = BulkStatusApi(clock, _input["ready_every"])
+    hooks = RecordResponses()
+    stats = PollStats(aggregate=False)
+    completed = []
+    for key, _ in poll_batch_iter(
+        api.describe,
+        range(_input["keys"]),
+        hooks=hooks,
+        stats=stats,
+        **_poll_kwargs(_input, clock),
+    ):
+        completed.append(key)
+        clock.now += _input["consumer_time"]
+    logger.info(stats.to_dict())
+    assert completed == expected_output["completed"]
+    assert hooks.retry_responses == expected_output["retry_responses"]
+    assert hooks.success_response == expected_output["success_response"]
+    for name, value in expected_output["stats"].items():
+        assert getattr(stats, name) == value
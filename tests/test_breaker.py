@@ -0,0 +1,158 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "breaker"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.breaker import (  # noqa: E402
+    CircuitBreaker,
+    RetryBudget,
+)
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollCircuitOpen,
+    PollTimeLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["circuit_breaker", "circuit_open"]),
+)
+def test_01_circuit_breaker(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    breaker = CircuitBreaker(clock=clock.monotonic, **_input["breaker_kwargs"])
+    poll_kwargs.update(
+        breaker=breaker,
+        ignore_exceptions=(ConnectionError,),
+        clock=clock.monotonic,
+        sleep=clock.sleep,
+    )
+    calls = []
+
+    def failing():
+        calls.append(clock.now)
+        raise ConnectionError("service unavailable")
+
+    with pytest.raises(PollCircuitOpen):
+        poll(failing, **poll_kwargs)
+    assert len(calls) == expected_output["calls"]
+    assert breaker.state == expected_output["state"]
+
+    calls.clear()
+    with pytest.raises(PollCircuitOpen):
+        poll(failing, **poll_kwargs)
+    assert len(calls) == expected_output["calls_while_open"]
+    logger.info(breaker.to_dict())
+
+    clock.now += breaker.retry_after()
+    assert poll(lambda: True, **poll_kwargs) is True
+    assert breaker.state == expected_output["state_after_probe"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["retry_budget", "success"]),
+)
+def test_02_retry_budget(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    budget = RetryBudget(clock=clock.monotonic, **_input["budget_kwargs"])
+    calls = []
+
+    def flaky():
+        calls.append(clock.now)
+        if len(calls) <= _input["failures"]:
+            raise ConnectionError("service unavailable")
+        return True
+
+    poll(
+        flaky,
+        retry_budget=budget,
+        ignore_exceptions=(ConnectionError,),
+        clock=clock.monotonic,
+        sleep=clock.sleep,
+        **poll_kwargs,
+    )
+    logger.info(budget.to_dict())
+    assert clock.sleeps == expected_output["sleeps"]
+    assert budget.delayed == expected_output["delayed"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["retry_budget", "error"]),
+)
+def test_03_retry_budget_deadline(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    budget = RetryBudget(clock=clock.monotonic, **_input["budget_kwargs"])
+    calls = []
+
+    def failing():
+        calls.append(clock.now)
+        raise ConnectionError("service unavailable")
+
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(
+            failing,
+            retry_budget=budget,
+            ignore_exceptions=(ConnectionError,),
+            clock=clock.monotonic,
+            sleep=clock.sleep,
+            **poll_kwargs,
+        )
+    logger.info(budget.to_dict())
+    assert clock.sleeps == expected_output["sleeps"]
+    assert len(calls) == expected_output["calls"]
+    assert budget.to_dict() == expected_output["budget"]
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "cache"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.cache import ResultCache  # noqa: E402
+from topshelfsoftware_polling.coalesce import make_key  # noqa: E402
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollAttemptLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.polling import poll, poll_async  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class _RecordingTarget:
+    """Returns its args and records each call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args):
+        self.calls.append(list(args))
+        return list(args)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["cache", "success"])
+)
+def test_01_cache(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    target = _RecordingTarget()
+    cache = ResultCache(**_input["cache_kwargs"])
+    for args in _input["polls"]:
+        assert poll(target, args=tuple(args), cache=cache) == args
+    assert target.calls == expected_output["calls"]
+    assert cache.hits == expected_output["hits"]
+    assert cache.misses == expected_output["misses"]
+    assert len(cache) <= _input["cache_kwargs"]["maxsize"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["cache", "ttl"])
+)
+def test_02_cache_ttl(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    target = _RecordingTarget()
+    clock = VirtualClock()
+    cache = ResultCache(ttl=_input["ttl"], clock=clock.monotonic)
+    asyncio.run(poll_async(target, args=(1,), cache=cache))
+    hits = []
+    for seconds in _input["advance"]:
+        clock.now += seconds
+        before = cache.hits
+        asyncio.run(poll_async(target, args=(1,), cache=cache))
+        hits.append(cache.hits > before)
+    assert hits == expected_output["hits"]
+    assert len(target.calls) == expected_output["calls"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["cache", "invalidate"])
+)
+def test_03_cache_invalidate(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    target = _RecordingTarget()
+    cache = ResultCache()
+    args = tuple(_input["args"])
+    key = make_key(target, args)
+    poll(target, args=args, cache=cache)
+    assert key in cache
+    invalidated = [cache.invalidate(key), cache.invalidate(key)]
+    poll(target, args=args, cache=cache)
+    assert invalidated == expected_output["invalidated"]
+    assert len(target.calls) == expected_output["calls"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["cache", "error"])
+)
+def test_04_cache_error(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    cache = ResultCache()
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(lambda: None, cache=cache, **poll_kwargs)
+    assert len(cache) == expected_output["cached"]
@@ -0,0 +1,167 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import (
+    FakeLambdaContext,
+    VirtualClock,
+    get_json_files,
+    print_section_break,
+)
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "checkpoint"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.checkpoint import (  # noqa: E402
+    CheckpointStore,  # noqa: F401, not used explicitly, evaluated
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from topshelfsoftware_polling.exceptions import (  # noqa: E402, F401
+    PollTimeLimitReached,
+)
+from topshelfsoftware_polling.hooks import PollHooks  # noqa: E402
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.schedule import Exponential  # noqa: E402, F401
+
+# wall clock time at which the virtual clock starts
+WALL_START = 1_700_000_000
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class RecordAttempts(PollHooks):
+    def __init__(self):
+        self.attempts = []
+
+    def on_attempt(self, record):
+        self.attempts.append(record.attempt)
+
+
+def _make_store(kind: str, path, clock: VirtualClock):
+    if kind == "file":
+        return FileCheckpointStore(str(path), clock=clock.time)
+    return SQLiteCheckpointStore(str(path / "polls.db"), clock=clock.time)
+
+
+def _run_invocations(_input: dict, store, clock: VirtualClock) -> dict:
+    """Poll once per invocation, as separate Lambda invocations would."""
+    calls = []
+    output = {
+        "attempts": [],
+        "sleeps": [],
+        "exceptions": [],
+        "messages": [],
+        "checkpoint": [],
+    }
+    for invocation in _input["invocations"]:
+        clock.now = invocation["start"]
+        clock.sleeps = []
+        hooks = RecordAttempts()
+        context = FakeLambdaContext(
+            invocation["lambda_time"] * 1000, clock=clock
+        )
+
+        def target():
+            calls.append(clock.now)
+            return len(calls) >= _input["succeed_on_attempt"]
+
+        exception = message = None
+        try:
+            poll(
+                target,
+                step_fun=eval(_input["schedule"]),
+                timeout=_input["timeout"],
+                lambda_context=context,
+                lambda_margin=0,
+                hooks=hooks,
+                clock=clock.monotonic,
+                sleep=clock.sleep,
+                checkpoint=store,
+                checkpoint_key="job-1",
+            )
+        except PollTimeLimitReached as e:
+            exception, message = type(e).__name__, str(e)
+        saved = store.load("job-1")
+        logger.info(f"Invocation {invocation}: checkpoint {saved}")
+        output["attempts"].append(hooks.attempts)
+        output["sleeps"].append([round(s, 6) for s in clock.sleeps])
+        output["exceptions"].append(exception)
+        output["messages"].append(message)
+        output["checkpoint"].append(
+            None
+            if saved is None
+            else {
+                "attempt": saved.attempt,
+                "step": saved.step,
+                "next_attempt": round(saved.next_attempt - WALL_START, 6),
+            }
+        )
+    return output
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["resume", "success"])
+)
+def test_01_resume(get_event_as_dict, tmp_path):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock(wall_start=WALL_START)
+    store = _make_store(_input["store"], tmp_path, clock)
+    assert _run_invocations(_input, store, clock) == expected_output
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["resume", "error"])
+)
+def test_02_resume_error(get_event_as_dict, tmp_path):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock(wall_start=WALL_START)
+    store = _make_store(_input["store"], tmp_path, clock)
+    assert _run_invocations(_input, store, clock) == expected_output
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["store", "error"])
+)
+def test_03_store_abstract(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    with pytest.raises(eval(expected_output["exception"])):
+        eval(_input["store"])
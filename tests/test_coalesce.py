@@ -0,0 +1,223 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "coalesce"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.coalesce import get_single_flight  # noqa: E402
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollTimeLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class _Target:
+    """Counts calls and succeeds on the `succeed_on_attempt`-th call."""
+
+    def __init__(self, succeed_on_attempt: int, call_duration: float = 0):
+        self.succeed_on_attempt = succeed_on_attempt
+        self.call_duration = call_duration
+        self.calls = 0
+        self.called = threading.Event()
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            calls = self.calls
+        self.called.set()
+        time.sleep(self.call_duration)
+        return calls if calls >= self.succeed_on_attempt else None
+
+
+def _run_leader_follower(target: _Target, leader_kwargs, follower_kwargs):
+    """Start a leader poll, then an identical poll once the leader has
+    called the target; return the outcome of each."""
+    outcomes = {}
+
+    def run(role, poll_kwargs):
+        try:
+            outcomes[role] = poll(target, **poll_kwargs)
+        except Exception as e:
+            outcomes[role] = e
+
+    for poll_kwargs in (leader_kwargs, follower_kwargs):
+        poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    leader = threading.Thread(target=run, args=("leader", leader_kwargs))
+    leader.start()
+    target.called.wait()
+    follower = threading.Thread(target=run, args=("follower", follower_kwargs))
+    follower.start()
+    leader.join()
+    follower.join()
+    return outcomes
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["coalesce", "success"])
+)
+def test_01_coalesce(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    target = _Target(_input["succeed_on_attempt"], _input["call_duration"])
+    barrier = threading.Barrier(_input["callers"])
+    results = []
+
+    def run():
+        barrier.wait()
+        results.append(poll(target, **poll_kwargs))
+
+    threads = [threading.Thread(target=run) for _ in range(_input["callers"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert target.calls == expected_output["calls"]
+    assert results == [expected_output["calls"]] * _input["callers"]
+    assert len(get_single_flight()) == 0
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["coalesce", "resume"])
+)
+def test_02_coalesce_resume(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    target = _Target(_input["succeed_on_attempt"])
+    outcomes = _run_leader_follower(
+        target, _input["leader_kwargs"], _input["follower_kwargs"]
+    )
+    logger.info(outcomes)
+    assert isinstance(
+        outcomes["leader"], eval(expected_output["leader_exception"])
+    )
+    assert outcomes["follower"] == expected_output["calls"]
+    assert target.calls == expected_output["calls"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(
+        MODULE_EVENTS_DIR, ["coalesce", "error", "follower_timeout"]
+    ),
+)
+def test_03_coalesce_follower_timeout(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    target = _Target(_input["succeed_on_attempt"])
+    outcomes = _run_leader_follower(
+        target, _input["leader_kwargs"], _input["follower_kwargs"]
+    )
+    logger.info(outcomes)
+    assert isinstance(
+        outcomes["follower"], eval(expected_output["follower_exception"])
+    )
+    assert outcomes["leader"] == expected_output["calls"]
+    assert target.calls == expected_output["calls"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["make_key", "error"])
+)
+def test_04_make_key_unhashable(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(lambda ids: True, kwargs=_input["kwargs"], coalesce=True)
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["coalesce", "error", "raise_exc"]),
+)
+def test_05_coalesce_raise_exception(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    calls = []
+
+    def target():
+        calls.append(1)
+        time.sleep(_input["call_duration"])
+        raise eval(_input["exception"])
+
+    barrier = threading.Barrier(_input["callers"])
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            poll(target, **poll_kwargs)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(_input["callers"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.info(errors)
+    assert len(calls) == expected_output["calls"]
+    assert [type(e).__name__ for e in errors] == [
+        expected_output["exception"]
+    ] * _input["callers"]
+    assert len({id(e) for e in errors}) == _input["callers"]
+    assert len(get_single_flight()) == 0
@@ -25,6 +25,9 @@ logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
 # ----------------------------------------------------------------------------#
 from topshelfsoftware_polling.exceptions import (  # noqa: E402
     PollAttemptLimitReached,
+    PollAttemptTimeout,
+    PollCircuitOpen,
+    PollTerminalFailure,
     PollTimeLimitReached,
 )
 
@@ -72,3 +75,68 @@ def test_02_poll_time_limit_reached(get_event_as_dict):
             assert str(e) == expected_output
             logger.error(e)
             raise e
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll_attempt_timeout"]),
+)
+def test_03_poll_attempt_timeout(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    exc_msg_input: str = get_event_as_dict["input"]["exc_msg"]
+    expected_output: str = get_event_as_dict["expected_output"]["exc_msg"]
+
+    with pytest.raises(PollAttemptTimeout):
+        try:
+            raise PollAttemptTimeout(exc_msg_input)
+        except Exception as e:
+            assert str(e) == expected_output
+            logger.error(e)
+            raise e
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll_circuit_open"]),
+)
+def test_04_poll_circuit_open(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    exc_msg_input: str = get_event_as_dict["input"]["exc_msg"]
+    expected_output: str = get_event_as_dict["expected_output"]["exc_msg"]
+
+    with pytest.raises(PollCircuitOpen):
+        try:
+            raise PollCircuitOpen(exc_msg_input)
+        except Exception as e:
+            assert str(e) == expected_output
+            logger.error(e)
+            raise e
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll_terminal_failure"]),
+)
+def test_05_poll_terminal_failure(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    exc_msg_input: str = get_event_as_dict["input"]["exc_msg"]
+    response: dict = get_event_as_dict["input"]["response"]
+    expected_output: str = get_event_as_dict["expected_output"]["exc_msg"]
+
+    with pytest.raises(PollTerminalFailure):
+        try:
+            raise PollTerminalFailure(exc_msg_input, response=response)
+        except Exception as e:
+            assert str(e) == expected_output
+            assert e.response == response
+            logger.error(e)
+            raise e
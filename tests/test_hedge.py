@@ -0,0 +1,106 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "hedge"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollAttemptLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.hedge import Hedge  # noqa: E402
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.stats import PollStats  # noqa: E402
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+def _make_target(latencies: list):
+    """Target sleeping for the next latency of `latencies`, the last one
+    repeating, and counting its calls."""
+    calls = []
+    lock = threading.Lock()
+
+    def target():
+        with lock:
+            calls.append(1)
+            latency = latencies[min(len(calls), len(latencies)) - 1]
+        time.sleep(latency)
+        return True
+
+    return target, calls
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["hedge", "success"])
+)
+def test_01_hedge(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    hedge = Hedge(**_input["hedge_kwargs"])
+    for latency in _input["observed"]:
+        hedge.observe(latency)
+    assert hedge.delay() == expected_output["delay"]
+
+    target, calls = _make_target(_input["latencies"])
+    stats = PollStats(aggregate=False)
+    start = time.monotonic()
+    poll(target, hedge=hedge, stats=stats, **_input["poll_kwargs"])
+    elapsed = time.monotonic() - start
+    logger.info(f"{hedge.to_dict()} in {elapsed:.3f} seconds")
+    assert elapsed < expected_output["max_elapsed"]
+    assert stats.hedges == hedge.hedges == expected_output["hedges"]
+    assert hedge.wins == expected_output["wins"]
+    assert len(calls) == expected_output["calls"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["hedge", "error"])
+)
+def test_02_hedge_error(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    hedge = Hedge(**_input["hedge_kwargs"])
+    target, calls = _make_target(_input["latencies"])
+    stats = PollStats(aggregate=False)
+    start = time.monotonic()
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(target, hedge=hedge, stats=stats, **_input["poll_kwargs"])
+    assert time.monotonic() - start < expected_output["max_elapsed"]
+    assert len(calls) == expected_output["calls"]
+    assert stats.hedges == hedge.hedges == expected_output["hedges"]
+    assert hedge.wins == expected_output["wins"]
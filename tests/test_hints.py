@@ -0,0 +1,133 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "hints"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollTimeLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.hints import retry_after  # noqa: E402
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.step import step_constant  # noqa: E402
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class _HTTPError(Exception):
+    def __init__(self, headers: dict):
+        super().__init__("429 Too Many Requests")
+        self.response = SimpleNamespace(headers=headers)
+
+
+def _make_target(responses: list):
+    """Target returning `responses` in turn, raising `_HTTPError` for the
+    entries with a `raise` key."""
+    calls = []
+
+    def target() -> dict:
+        res = responses[len(calls)]
+        calls.append(res)
+        if "raise" in res:
+            raise _HTTPError(res["raise"])
+        return res
+
+    return target, calls
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["retry_after"])
+)
+def test_01_retry_after(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    delay = retry_after(_input["value"], clock=lambda: _input["now"])
+    assert delay == expected_output["delay"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll", "hint", "success"]),
+)
+def test_02_poll_step_hint(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    target, calls = _make_target(_input["responses"])
+    res = poll(
+        target,
+        step_fun=step_constant,
+        step_fun_kwargs={"step": 1},
+        step_hint=retry_after,
+        timeout=_input["timeout"],
+        check_success=lambda res: res["status"] == "DONE",
+        ignore_exceptions=(_HTTPError,),
+        clock=clock.monotonic,
+        sleep=clock.sleep,
+    )
+    assert res["status"] == "DONE"
+    assert clock.sleeps == expected_output["sleeps"]
+    assert len(calls) == expected_output["attempts"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll", "hint", "error"])
+)
+def test_03_poll_step_hint_deadline(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    target, calls = _make_target(_input["responses"])
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(
+            target,
+            step_fun=step_constant,
+            step_fun_kwargs={"step": 1},
+            step_hint=retry_after,
+            timeout=_input["timeout"],
+            check_success=lambda res: res["status"] == "DONE",
+            ignore_exceptions=(_HTTPError,),
+            clock=clock.monotonic,
+            sleep=clock.sleep,
+        )
+    assert clock.sleeps == expected_output["sleeps"]
+    assert len(calls) == expected_output["attempts"]
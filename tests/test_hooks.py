@@ -0,0 +1,125 @@
+import os
+import re
+import sys
+from typing import Callable
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "hooks"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollAttemptLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.hooks import (  # noqa: E402
+    AttemptRecord,
+    PollHooks,
+)
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+class RecordingHooks(PollHooks):
+    """Collect the name of each hook called and its record."""
+
+    def __init__(self):
+        self.events = []
+        self.records = []
+
+    def _record(self, event: str, record: AttemptRecord):
+        self.events.append(event)
+        self.records.append(record)
+
+    def on_attempt(self, record):
+        self._record("on_attempt", record)
+
+    def on_exception(self, record):
+        self._record("on_exception", record)
+
+    def on_retry(self, record):
+        self._record("on_retry", record)
+
+    def on_success(self, record):
+        self._record("on_success", record)
+
+    def on_give_up(self, record):
+        self._record("on_give_up", record)
+
+
+def _prepare_poll_kwargs(poll_kwargs: dict) -> dict:
+    if "step_fun" in poll_kwargs:
+        poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    if "ignore_exceptions" in poll_kwargs:
+        poll_kwargs["ignore_exceptions"] = tuple(
+            eval(exc) for exc in poll_kwargs["ignore_exceptions"]
+        )
+    return poll_kwargs
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["hooks", "success"])
+)
+def test_01_hooks_success(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _prepare_poll_kwargs(_input["poll_kwargs"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    hooks = RecordingHooks()
+    res = poll(lambda_fun, hooks=hooks, **poll_kwargs)
+    assert hooks.events == expected_output["events"]
+    assert hooks.records[-1].response == res
+    assert hooks.records[-1].attempt == 1
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["hooks", "give_up"])
+)
+def test_02_hooks_give_up(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _prepare_poll_kwargs(_input["poll_kwargs"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+    expected_error: dict = expected_output["error"]
+
+    hooks = RecordingHooks()
+    with pytest.raises(
+        eval(expected_error["type"]),
+        match=re.escape(expected_error["message"]),
+    ) as exc_info:
+        poll(lambda_fun, hooks=hooks, **poll_kwargs)
+    assert hooks.events == expected_output["events"]
+    assert hooks.records[-1].exception is exc_info.value
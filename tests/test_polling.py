@@ -1,13 +1,20 @@
+import asyncio
 import os
 import re
 import sys
+import time
 from typing import Callable
 
 import pytest
 
 from topshelfsoftware_logging import get_logger
 
-from conftest import get_json_files, print_section_break
+from conftest import (
+    FakeLambdaContext,  # noqa: F401, not used explicitly, evaluated
+    VirtualClock,
+    get_json_files,
+    print_section_break,
+)
 
 # ----------------------------------------------------------------------------#
 #                               --- Globals ---                               #
@@ -26,16 +33,91 @@ logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
 #                           --- Module Imports ---                            #
 # ----------------------------------------------------------------------------#
 from topshelfsoftware_polling.polling import (  # noqa: E402
+    NOT_MODIFIED,
     PollAttemptLimitReached,
+    PollTerminalFailure,
     PollTimeLimitReached,
+    logger as polling_logger,
     poll,
+    poll_async,
+    poll_iter,
+    poll_until_changed,
 )
+from topshelfsoftware_polling.stats import PollStats  # noqa: E402
 from topshelfsoftware_polling.step import (  # noqa: E402
     step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
     step_exponential_backoff,  # noqa: F401, same as above
 )
 
 
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+async def _async_identity(value):
+    """Coroutine target that returns its argument."""
+    await asyncio.sleep(0)
+    return value
+
+
+def _hang_first_call(seconds: float, value):
+    """Target that blocks on its first call and returns `value` after."""
+    calls = []
+
+    def target():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(seconds)
+        return value
+
+    return target
+
+
+class _StrCounter:
+    """Falsy response that counts how often it is converted to a string."""
+
+    str_calls = 0
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        type(self).str_calls += 1
+        return "<_StrCounter>"
+
+
+class _LongPollServer:
+    """Target that holds each call until its resource is ready or the
+    requested wait is over, in virtual time."""
+
+    def __init__(self, clock: VirtualClock, ready_at: float, waits: bool):
+        self.clock = clock
+        self.ready_at = ready_at
+        self.server_waits = waits
+        self.waits = []
+
+    def __call__(self, wait_time: float) -> bool:
+        self.waits.append(wait_time)
+        if self.server_waits:
+            self.clock.now = min(self.clock.now + wait_time, self.ready_at)
+        return self.clock.now >= self.ready_at
+
+
+class _VersionedResource:
+    """Target serving a resource whose version and status change from call
+    to call. Returns `NOT_MODIFIED` when passed the current version."""
+
+    def __init__(self, states: list):
+        self.states = states
+        self.passed = []
+
+    def __call__(self, version=None):
+        self.passed.append(version)
+        current, status = self.states[len(self.passed) - 1]
+        if version == current:
+            return NOT_MODIFIED
+        return {"version": current, "status": status}
+
+
 # ----------------------------------------------------------------------------#
 #                                --- TESTS ---                                #
 # ----------------------------------------------------------------------------#
@@ -134,3 +216,390 @@ def test_04_poll_raise_exception(get_event_as_dict):
             lambda_fun,
             **poll_kwargs,
         )
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll_async", "success", "truthy"]),
+)
+def test_05_poll_async_truthy(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _input["poll_kwargs"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    res = asyncio.run(
+        poll_async(
+            lambda_fun,
+            **poll_kwargs,
+        )
+    )
+    assert res == expected_output["res"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll_async", "error", "poll_exc"]),
+)
+def test_06_poll_async_poll_exception(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_error: dict = get_event_as_dict["expected_output"]["error"]
+
+    with pytest.raises(
+        eval(expected_error["type"]),
+        match=re.escape(expected_error["message"]),
+    ):
+        asyncio.run(
+            poll_async(
+                lambda_fun,
+                **poll_kwargs,
+            )
+        )
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll", "success", "remaining_kwarg"]),
+)
+def test_07_poll_remaining_kwarg(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _input["poll_kwargs"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    res = poll(
+        lambda_fun,
+        **poll_kwargs,
+    )
+    assert res == expected_output["res"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll", "deadline"])
+)
+def test_08_poll_deadline(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    if "lambda_context" in poll_kwargs:
+        poll_kwargs["lambda_context"] = eval(poll_kwargs["lambda_context"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+    expected_error: dict = expected_output["error"]
+
+    start = time.monotonic()
+    with pytest.raises(
+        eval(expected_error["type"]),
+        match=re.escape(expected_error["message"]),
+    ):
+        poll(
+            lambda_fun,
+            **poll_kwargs,
+        )
+    assert time.monotonic() - start < expected_output["max_elapsed"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll", "success", "attempt_timeout"]),
+)
+def test_09_poll_attempt_timeout(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    start = time.monotonic()
+    res = poll(
+        lambda_fun,
+        **poll_kwargs,
+    )
+    assert res == expected_output["res"]
+    assert time.monotonic() - start < expected_output["max_elapsed"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll", "lazy_logging"])
+)
+def test_10_poll_lazy_logging(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    _StrCounter.str_calls = 0
+    level = polling_logger.level
+    polling_logger.setLevel(_input["logger_level"])
+    try:
+        with pytest.raises(PollAttemptLimitReached):
+            poll(
+                lambda_fun,
+                **poll_kwargs,
+            )
+    finally:
+        polling_logger.setLevel(level)
+    assert (_StrCounter.str_calls > 0) == expected_output["formatted"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll", "long_poll"])
+)
+def test_11_poll_long_poll(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    server = _LongPollServer(clock, _input["ready_at"], _input["server_waits"])
+    try:
+        poll(server, clock=clock.monotonic, sleep=clock.sleep, **poll_kwargs)
+    except Exception as e:
+        assert type(e).__name__ == expected_output["exception"]
+    else:
+        assert expected_output["exception"] is None
+    assert server.waits == expected_output["waits"]
+    assert clock.sleeps == expected_output["sleeps"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll_iter"])
+)
+def test_12_poll_iter(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    responses = iter(_input["responses"])
+    calls = []
+
+    def target():
+        calls.append(1)
+        return next(responses)
+
+    stats = PollStats(aggregate=False)
+    records = []
+    try:
+        for record in poll_iter(
+            target,
+            check_success=eval(_input["check_success"]),
+            stats=stats,
+            **poll_kwargs,
+        ):
+            logger.info(record)
+            records.append(record)
+            if len(records) == _input["stop_after"]:
+                break
+    except Exception as e:
+        assert type(e).__name__ == expected_output["exception"]
+    else:
+        assert expected_output["exception"] is None
+    assert [r.response for r in records] == expected_output["responses"]
+    assert [r.attempt for r in records] == list(range(1, len(records) + 1))
+    assert len(calls) == expected_output["calls"]
+    assert stats.outcome == expected_output["outcome"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["check_failure"])
+)
+def test_13_poll_check_failure(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    responses = iter(_input["responses"])
+    calls = []
+
+    def target():
+        calls.append(1)
+        return next(responses)
+
+    stats = PollStats(aggregate=False)
+    kwargs = dict(
+        check_success=eval(_input["check_success"]),
+        check_failure=eval(_input["check_failure"]),
+        stats=stats,
+        **poll_kwargs,
+    )
+    try:
+        if _input["driver"] == "poll_async":
+            res = asyncio.run(poll_async(target, **kwargs))
+        else:
+            res = poll(target, **kwargs)
+    except PollTerminalFailure as e:
+        logger.info(e)
+        assert type(e).__name__ == expected_output["exception"]
+        res = e.response
+    else:
+        assert expected_output["exception"] is None
+    assert res == expected_output["response"]
+    assert len(calls) == expected_output["calls"]
+    assert stats.outcome == expected_output["outcome"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["version"])
+)
+def test_14_poll_version(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    resource = _VersionedResource(_input["states"])
+    checks = []
+
+    def check_success(res: dict) -> bool:
+        checks.append(res)
+        return res["status"] == "DONE"
+
+    stats = PollStats(aggregate=False)
+    kwargs = dict(
+        check_success=check_success,
+        get_version=lambda res: res["version"],
+        stats=stats,
+        **poll_kwargs,
+    )
+    if _input["driver"] == "poll_async":
+        res = asyncio.run(poll_async(resource, **kwargs))
+    else:
+        res = poll(resource, **kwargs)
+    assert res == expected_output["response"]
+    assert resource.passed == expected_output["passed"]
+    assert len(checks) == expected_output["checks"]
+    assert stats.unchanged == expected_output["unchanged"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll_until_changed"])
+)
+def test_15_poll_until_changed(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    if "get_version" in poll_kwargs:
+        poll_kwargs["get_version"] = eval(poll_kwargs["get_version"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    resource = _VersionedResource(_input["states"])
+    res = None
+    if expected_output["exception"] is not None:
+        with pytest.raises(eval(expected_output["exception"])):
+            poll_until_changed(resource, **poll_kwargs)
+    else:
+        res = poll_until_changed(resource, **poll_kwargs)
+    assert res == expected_output["response"]
+    assert resource.passed == expected_output["passed"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll", "positional"])
+)
+def test_16_poll_positional_args(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    calls = []
+
+    def target() -> bool:
+        calls.append(1)
+        if len(calls) == 1:
+            raise eval(_input["raise_first"])
+        return True
+
+    res = poll(target, *[eval(arg) for arg in _input["args"]])
+    assert res == expected_output["response"]
+    assert len(calls) == expected_output["calls"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll", "shared_step_kwargs"]),
+)
+def test_17_poll_shared_step_fun_kwargs(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    step_fun_kwargs = _input["step_fun_kwargs"]
+    attempts = [[] for _ in _input["responses"]]
+    polls = []
+    for seen, responses in zip(attempts, _input["responses"]):
+
+        def step_fun(attempt: int, step: float, seen=seen) -> float:
+            seen.append(attempt)
+            return step
+
+        polls.append(
+            poll_iter(
+                lambda responses=iter(responses): next(responses),
+                step_fun=step_fun,
+                step_fun_kwargs=step_fun_kwargs,
+            )
+        )
+    # advance the polls in turn until all are done
+    while polls:
+        for it in list(polls):
+            if next(it, None) is None:
+                polls.remove(it)
+    assert attempts == expected_output["attempts"]
+    assert step_fun_kwargs == expected_output["step_fun_kwargs"]
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "ratelimit"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollTimeLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.polling import poll, poll_async  # noqa: E402
+from topshelfsoftware_polling.ratelimit import (  # noqa: E402
+    RateLimiter,
+    get_rate_limiter,
+)
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["rate_limiter", "success", "threads"]),
+)
+def test_01_rate_limiter_threads(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    limiter = get_rate_limiter(_input["name"], _input["rate"], _input["burst"])
+    assert get_rate_limiter(_input["name"], rate=1) is limiter
+    call_times = []
+    lock = threading.Lock()
+
+    def run():
+        calls = []
+
+        def target():
+            with lock:
+                call_times.append(time.monotonic())
+            calls.append(1)
+            return len(calls) >= _input["attempts"]
+
+        poll(target, rate_limiter=limiter, **poll_kwargs)
+
+    threads = [threading.Thread(target=run) for _ in range(_input["threads"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.info(limiter.to_dict())
+    assert len(call_times) == expected_output["calls"]
+    assert max(call_times) - min(call_times) >= expected_output["min_duration"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["rate_limiter", "success", "async"]),
+)
+def test_02_rate_limiter_async(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    limiter = RateLimiter(
+        _input["rate"], burst=_input["burst"], clock=clock.monotonic
+    )
+    call_times = []
+
+    async def target():
+        call_times.append(clock.now)
+        return len(call_times) >= _input["attempts"]
+
+    asyncio.run(
+        poll_async(
+            target,
+            rate_limiter=limiter,
+            clock=clock.monotonic,
+            sleep=clock.sleep_async,
+            **poll_kwargs,
+        )
+    )
+    assert call_times == pytest.approx(expected_output["call_times"])
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["rate_limiter", "error", "poll_exc"]),
+)
+def test_03_rate_limiter_timeout(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    limiter = RateLimiter(
+        _input["rate"], burst=_input["burst"], clock=clock.monotonic
+    )
+    call_times = []
+
+    def target():
+        call_times.append(clock.now)
+        return False
+
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(
+            target,
+            rate_limiter=limiter,
+            clock=clock.monotonic,
+            sleep=clock.sleep,
+            **poll_kwargs,
+        )
+    assert call_times == pytest.approx(expected_output["call_times"])
+    assert limiter.calls == expected_output["limiter_calls"]
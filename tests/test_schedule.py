@@ -0,0 +1,111 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "schedule"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.schedule import (  # noqa: E402, F401
+    Chain,
+    Constant,
+    DecorrelatedJitter,
+    Exponential,
+    FullJitter,
+    Schedule,
+)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["materialize", "success"]),
+)
+def test_01_materialize(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    if "schedules" in _input:
+        for schedule in map(eval, _input["schedules"]):
+            steps = schedule.materialize(_input["n"], seed=_input["seed"])
+            logger.info(f"{type(schedule).__name__}: {list(steps)}")
+            assert len(steps) == _input["n"]
+            assert min(steps) >= expected_output["min_step"]
+            assert max(steps) <= expected_output["max_step"]
+            assert steps == schedule.materialize(
+                _input["n"], seed=_input["seed"]
+            )
+        return
+
+    schedule = eval(_input["schedule"])
+    steps = schedule.materialize(_input["n"])
+    assert list(steps) == expected_output["steps"]
+    # schedules hold no state between iterations
+    assert schedule.materialize(_input["n"]) == steps
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["poll", "success", "schedule"]),
+)
+def test_02_poll_schedule(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    calls = []
+
+    def target():
+        calls.append(clock.now)
+        return len(calls) >= _input["succeed_on_attempt"]
+
+    poll(
+        target,
+        step_fun=eval(_input["schedule"]),
+        clock=clock.monotonic,
+        sleep=clock.sleep,
+    )
+    assert clock.sleeps == expected_output["sleeps"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["schedule", "error"])
+)
+def test_03_schedule_abstract(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    with pytest.raises(eval(expected_output["exception"])):
+        eval(_input["schedule"])
@@ -0,0 +1,119 @@
+import os
+import re
+import sys
+import threading
+import time
+from typing import Callable
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "scheduler"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollAttemptLimitReached,  # noqa: F401, not used explicitly, evaluated
+    PollTimeLimitReached,  # noqa: F401, same as above
+)
+from topshelfsoftware_polling.scheduler import PollScheduler  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["submit", "success", "truthy"]),
+)
+def test_01_submit_truthy(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    submit_kwargs: dict = _input["submit_kwargs"]
+    submit_kwargs["step_fun"] = eval(submit_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    counts = {}
+    lock = threading.Lock()
+
+    def target(key):
+        with lock:
+            counts[key] = counts.get(key, 0) + 1
+            return key if counts[key] >= _input["attempts"] else None
+
+    keys = range(1, _input["polls"] + 1)
+    with PollScheduler() as scheduler:
+        futures = {
+            key: scheduler.submit(target, args=(key,), **submit_kwargs)
+            for key in keys
+        }
+        results = {key: future.result() for key, future in futures.items()}
+    assert results == {key: key for key in keys}
+    assert set(counts.values()) == {expected_output["attempts"]}
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["submit", "error", "poll_exc"]),
+)
+def test_02_submit_poll_exception(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    lambda_fun: Callable = eval(_input["lambda_function"])
+    submit_kwargs: dict = _input["submit_kwargs"]
+    submit_kwargs["step_fun"] = eval(submit_kwargs["step_fun"])
+    expected_error: dict = get_event_as_dict["expected_output"]["error"]
+
+    with PollScheduler() as scheduler:
+        future = scheduler.submit(lambda_fun, **submit_kwargs)
+        with pytest.raises(
+            eval(expected_error["type"]),
+            match=re.escape(expected_error["message"]),
+        ):
+            future.result(timeout=5)
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["submit", "cancel"])
+)
+def test_03_submit_cancel(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    submit_kwargs: dict = get_event_as_dict["input"]["submit_kwargs"]
+    submit_kwargs["step_fun"] = eval(submit_kwargs["step_fun"])
+
+    calls = []
+    with PollScheduler() as scheduler:
+        future = scheduler.submit(lambda: calls.append(1), **submit_kwargs)
+        time.sleep(0.05)
+        assert future.cancel()
+        n_calls = len(calls)
+        time.sleep(0.05)
+    assert future.cancelled()
+    assert len(calls) <= n_calls + 1
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "simulate"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+np = pytest.importorskip("numpy")
+
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollAttemptLimitReached,
+    PollTimeLimitReached,
+)
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.simulate import simulate  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+    step_exponential_backoff,  # noqa: F401, same as above
+)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["simulate", "success", "matches_poll"]),
+)
+def test_01_simulate_matches_poll(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    step_fun_kwargs: dict = _input["step_fun_kwargs"]
+    poll_kwargs = {
+        "step_fun": eval(_input["step_fun"]),
+        "step_fun_kwargs": step_fun_kwargs,
+        "timeout": _input["timeout"],
+        "max_attempts": _input.get("max_attempts"),
+    }
+
+    calls, latencies = 0, []
+    for ready_time in _input["ready_times"]:
+        clock = VirtualClock()
+
+        def target():
+            nonlocal calls
+            calls += 1
+            return clock.now >= ready_time
+
+        try:
+            poll(
+                target,
+                clock=clock.monotonic,
+                sleep=clock.sleep,
+                log=False,
+                **{**poll_kwargs, "step_fun_kwargs": dict(step_fun_kwargs)},
+            )
+            latencies.append(clock.now - ready_time)
+        except (PollAttemptLimitReached, PollTimeLimitReached):
+            pass
+
+    result = simulate(_input["ready_times"], **poll_kwargs)
+    logger.info(result)
+    assert result.total_calls == calls
+    assert result.detected == len(latencies)
+    assert result.latency_max == pytest.approx(max(latencies))
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file",
+    get_json_files(MODULE_EVENTS_DIR, ["simulate", "success", "jitter"]),
+)
+def test_02_simulate_jitter(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    rng = np.random.default_rng(_input["seed"])
+    clients = _input["clients"]
+    result = simulate(
+        ready_times=np.full(clients, _input["ready_time"]),
+        step_fun_kwargs=_input["step_fun_kwargs"],
+        timeout=_input["timeout"],
+        start_times=rng.uniform(0, _input["start_window"], clients),
+        seed=_input["seed"],
+    )
+    logger.info(result)
+    assert result.clients == clients
+    assert result.detected == clients
+    assert result.latency_max <= expected_output["max_latency"]
+    assert (
+        result.peak_calls_per_second
+        <= expected_output["max_peak_calls_per_second"]
+    )
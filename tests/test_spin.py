@@ -0,0 +1,116 @@
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import VirtualClock, get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "spin"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollTimeLimitReached,  # noqa: F401, not used explicitly, evaluated
+)
+from topshelfsoftware_polling.spin import poll_spin  # noqa: E402
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+def _make_target(clock: VirtualClock, call_cost: float, ready_at: float):
+    """Target taking `call_cost` seconds, true from `ready_at` on."""
+    calls = []
+
+    def target() -> bool:
+        calls.append(clock.now)
+        clock.now += call_cost
+        return clock.now >= ready_at
+
+    return target, calls
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["spin", "success"])
+)
+def test_01_poll_spin(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    target, calls = _make_target(
+        clock, _input["call_cost"], _input["ready_at"]
+    )
+    assert poll_spin(
+        target,
+        clock=clock.monotonic,
+        sleep=clock.sleep,
+        **_input["poll_kwargs"],
+    )
+    assert len(calls) == expected_output["calls"]
+    assert clock.sleeps == pytest.approx(expected_output["sleeps"])
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["spin", "error"])
+)
+def test_02_poll_spin_time_limit(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    clock = VirtualClock()
+    target, calls = _make_target(
+        clock, _input["call_cost"], _input["ready_at"]
+    )
+    with pytest.raises(eval(expected_output["exception"])):
+        poll_spin(
+            target,
+            clock=clock.monotonic,
+            sleep=clock.sleep,
+            **_input["poll_kwargs"],
+        )
+    logger.info(f"Calls at {calls}")
+    assert len(calls) == expected_output["calls"]
+    assert clock.sleeps == pytest.approx(expected_output["sleeps"])
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["spin", "invalid"])
+)
+def test_03_poll_spin_invalid(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    with pytest.raises(
+        eval(expected_output["exception"]), match=expected_output["message"]
+    ):
+        poll_spin(lambda: True, **_input["poll_kwargs"])
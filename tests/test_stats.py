@@ -0,0 +1,101 @@
+import math
+import os
+import sys
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "stats"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.exceptions import (  # noqa: E402
+    PollAttemptLimitReached,
+)
+from topshelfsoftware_polling.polling import poll  # noqa: E402
+from topshelfsoftware_polling.stats import (  # noqa: E402
+    Histogram,
+    PollStats,
+    get_stats_aggregator,
+)
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["poll_stats"])
+)
+def test_01_poll_stats(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    calls = []
+
+    def target():
+        calls.append(1)
+        return len(calls) >= _input["succeed_on_attempt"]
+
+    stats = PollStats(name=_input["name"])
+    try:
+        poll(target, stats=stats, **poll_kwargs)
+    except PollAttemptLimitReached:
+        pass
+    logger.info(stats.to_dict())
+    assert stats.outcome == expected_output["outcome"]
+    assert stats.attempts == expected_output["attempts"]
+    assert len(stats.target_latencies) == expected_output["attempts"]
+    assert stats.sleep_time >= expected_output["min_sleep_time"]
+    assert stats.total_time >= (
+        stats.target_time + stats.check_time + stats.sleep_time
+    )
+    assert stats.percentile(50) <= stats.percentile(100)
+
+    aggregated = get_stats_aggregator().snapshot()[_input["name"]]
+    assert aggregated["outcomes"] == {expected_output["outcome"]: 1}
+    assert aggregated["target_latency"]["count"] == stats.attempts
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["histogram", "success"])
+)
+def test_02_histogram(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    histogram = Histogram(_input["bounds"])
+    for value in _input["values"]:
+        histogram.observe(value)
+    assert histogram.count == expected_output["count"]
+    assert list(histogram.counts) == expected_output["counts"]
+    assert histogram.percentile(50) == expected_output["p50"]
+    assert histogram.percentile(90) == expected_output["p90"]
+    assert histogram.percentile(100) == math.inf
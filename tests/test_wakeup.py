@@ -0,0 +1,166 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from topshelfsoftware_logging import get_logger
+
+from conftest import get_json_files, print_section_break
+
+# ----------------------------------------------------------------------------#
+#                               --- Globals ---                               #
+# ----------------------------------------------------------------------------#
+from __setup__ import TEST_EVENTS_PATH
+
+MODULE = "wakeup"
+MODULE_EVENTS_DIR = os.path.join(TEST_EVENTS_PATH, MODULE)
+
+# ----------------------------------------------------------------------------#
+#                               --- Logging ---                               #
+# ----------------------------------------------------------------------------#
+logger = get_logger(f"test_{MODULE}", stream=sys.stdout)
+
+# ----------------------------------------------------------------------------#
+#                           --- Module Imports ---                            #
+# ----------------------------------------------------------------------------#
+from topshelfsoftware_polling.polling import poll, poll_async  # noqa: E402
+from topshelfsoftware_polling.ratelimit import RateLimiter  # noqa: E402
+from topshelfsoftware_polling.step import (  # noqa: E402
+    step_constant,  # noqa: F401, not used explicitly, evaluated at runtime
+)
+
+
+# ----------------------------------------------------------------------------#
+#                               --- Helpers ---                               #
+# ----------------------------------------------------------------------------#
+def _make_source(kind: str):
+    """Return a wake-up source of the given kind and a function signalling
+    it."""
+    if kind == "event":
+        event = threading.Event()
+        return event, event.set
+    if kind == "condition":
+        cond = threading.Condition()
+
+        def notify():
+            with cond:
+                cond.notify_all()
+
+        return cond, notify
+    read_fd, write_fd = os.pipe()
+    return read_fd, lambda: os.write(write_fd, b"1")
+
+
+# ----------------------------------------------------------------------------#
+#                                --- TESTS ---                                #
+# ----------------------------------------------------------------------------#
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["wake", "success"])
+)
+def test_01_wake(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    source, signal = _make_source(_input["source"])
+    calls = []
+
+    def target():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            threading.Timer(_input["signal_after"], signal).start()
+        return len(calls) >= expected_output["attempts"]
+
+    poll(target, wake=source, **poll_kwargs)
+    elapsed = calls[-1] - calls[0]
+    logger.info(f"Woken after {elapsed:.3f} seconds")
+    assert len(calls) == expected_output["attempts"]
+    assert elapsed < expected_output["max_elapsed"]
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["wake_async", "success"])
+)
+def test_02_wake_async(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    calls = []
+
+    async def main():
+        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def target():
+            calls.append(loop.time())
+            if len(calls) == 1:
+                loop.call_later(_input["signal_after"], event.set)
+            return len(calls) >= expected_output["attempts"]
+
+        await poll_async(target, wake=event, **poll_kwargs)
+
+    asyncio.run(main())
+    assert len(calls) == expected_output["attempts"]
+    assert calls[-1] - calls[0] < expected_output["max_elapsed"]
+
+
+@pytest.mark.sad
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["wake", "error"])
+)
+def test_03_wake_unsupported(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    with pytest.raises(eval(expected_output["exception"])):
+        poll(lambda: True, wake=eval(_input["source"]))
+
+
+@pytest.mark.happy
+@pytest.mark.parametrize("event_dir", [MODULE_EVENTS_DIR])
+@pytest.mark.parametrize(
+    "event_file", get_json_files(MODULE_EVENTS_DIR, ["wake", "rate_limiter"])
+)
+def test_04_wake_rate_limiter(get_event_as_dict):
+    print_section_break()
+    logger.info(f"Test Description: {get_event_as_dict['description']}")
+    _input: dict = get_event_as_dict["input"]
+    poll_kwargs: dict = _input["poll_kwargs"]
+    poll_kwargs["step_fun"] = eval(poll_kwargs["step_fun"])
+    expected_output: dict = get_event_as_dict["expected_output"]
+
+    event = threading.Event()
+    calls = []
+
+    def target():
+        calls.append(time.monotonic())
+        threading.Timer(_input["signal_after"], event.set).start()
+        return len(calls) >= expected_output["attempts"]
+
+    poll(
+        target,
+        wake=event,
+        rate_limiter=RateLimiter(rate=_input["rate"]),
+        **poll_kwargs,
+    )
+    intervals = [b - a for a, b in zip(calls, calls[1:])]
+    logger.info(f"Intervals between calls: {intervals}")
+    assert len(calls) == expected_output["attempts"]
+    assert min(intervals) >= expected_output["min_interval"]
@@ -1,20 +1,22 @@
-import logging
-from typing import List, Union
+from typing import TYPE_CHECKING, List, Union
 
-from .polling import logger as polling_logger
+if TYPE_CHECKING:
+    import logging
 
 PACKAGE_NAME = "topshelfsoftware-polling"
 
 
 def debug():
     """Set the package Loggers to the DEBUG level."""
-    _set_logger_levels(level=logging.DEBUG)
+    _set_logger_levels(level="DEBUG")
     return
 
 
-def get_package_loggers() -> List[logging.Logger]:
+def get_package_loggers() -> List["logging.Logger"]:
     """Retrieve a list of the Loggers used in the package."""
-    loggers = [polling_logger]
+    from .polling import _get_logger
+
+    loggers = [_get_logger()]
     return loggers
 
 
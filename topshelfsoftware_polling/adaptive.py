@@ -0,0 +1,213 @@
+"""Adaptive step that learns the time to success of each kind of poll.
+
+`AdaptiveStep` keeps an EWMA of the time to success per key and schedules
+the first attempts of the next poll around it. The estimates are bounded
+and can be persisted to a JSON file so they survive a restart.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from .hooks import AttemptRecord, PollHooks
+from .step import step_exponential_backoff
+
+
+class AdaptiveStep:
+    """Step strategy that schedules attempts around the expected time to
+    success, learned per key from past polls.
+
+    For each key an exponentially weighted moving average (EWMA) of the
+    time to success and of its mean deviation is kept, as TCP does for
+    round-trip times. The first step waits until one deviation before the
+    expected completion; later steps start at half a deviation and back
+    off by `backoff_rate`. Keys without history fall back to
+    `step_exponential_backoff`. Steps never exceed `max_interval`, and the
+    poll itself clamps them to its `timeout`.
+
+    Use `for_key` to get the step function for one kind of poll; it also
+    records the time to success when passed as the poll `hooks`.
+
+    Parameters
+    ----------
+    alpha: float, optional
+        Weight of a new observation in the moving averages, in (0, 1].
+        Default is `0.25`.
+
+    base_interval: float, optional
+        Shortest step (in sec), and the first step for keys without history.
+        Default is `1.0`.
+
+    backoff_rate: float, optional
+        Multiplier applied to the step after each attempt past the
+        expected completion.
+        Default is `2`.
+
+    max_interval: float, optional
+        Maximum interval (in sec) for each step.
+        Default is `60.0`.
+
+    max_keys: int, optional
+        Maximum number of keys remembered. The least recently updated key
+        is forgotten when this is exceeded.
+        Default is `256`.
+
+    path: str, optional
+        JSON file the estimates are loaded from, if it exists, and saved to
+        after each update.
+        Default of `None` keeps the estimates in memory only.
+
+    >>> adaptive = AdaptiveStep(path="~/.cache/export_estimates.json")
+    >>> export_step = adaptive.for_key("export")
+    >>> poll(get_export, args=(export_id,), step_fun=export_step,
+    >>>      hooks=export_step, timeout=3600)
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.25,
+        base_interval: float = 1,
+        backoff_rate: float = 2,
+        max_interval: float = 60,
+        max_keys: int = 256,
+        path: Optional[str] = None,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.base_interval = base_interval
+        self.backoff_rate = backoff_rate
+        self.max_interval = max_interval
+        self.max_keys = max_keys
+        self.path = os.path.expanduser(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._estimates: OrderedDict = OrderedDict()  # key: [mean, dev]
+        if self.path is not None and os.path.exists(self.path):
+            self.load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._estimates)
+
+    def for_key(self, key: Hashable) -> "KeyedAdaptiveStep":
+        """Step function (and hooks) for polls identified by `key`."""
+        return KeyedAdaptiveStep(self, key)
+
+    def estimate(self, key: Hashable) -> Optional[float]:
+        """Expected time to success (in sec) for `key`, or `None` without
+        history."""
+        with self._lock:
+            entry = self._estimates.get(key)
+        return None if entry is None else entry[0]
+
+    def step(self, key: Hashable, attempt: int) -> float:
+        """Compute the step after attempt number `attempt` for `key`.
+
+        Returns
+        -------
+        float
+            Step (in sec).
+        """
+        with self._lock:
+            entry = self._estimates.get(key)
+        if entry is None:
+            return step_exponential_backoff(
+                attempt,
+                backoff_rate=self.backoff_rate,
+                base_interval=self.base_interval,
+                max_interval=self.max_interval,
+            )
+        mean, dev = entry
+        if attempt == 1:
+            step = mean - dev
+        else:
+            step = dev / 2 * pow(self.backoff_rate, attempt - 2)
+        return min(self.max_interval, max(self.base_interval, step))
+
+    def observe(self, key: Hashable, elapsed: float):
+        """Update the estimates for `key` with a time to success of
+        `elapsed` seconds."""
+        with self._lock:
+            entry = self._estimates.pop(key, None)
+            if entry is None:
+                entry = [elapsed, elapsed / 2]
+            else:
+                mean, dev = entry
+                entry = [
+                    mean + self.alpha * (elapsed - mean),
+                    dev + self.alpha * (abs(elapsed - mean) - dev),
+                ]
+            self._estimates[key] = entry
+            while len(self._estimates) > self.max_keys:
+                self._estimates.popitem(last=False)
+        if self.path is not None:
+            self.save()
+
+    def forget(self, key: Hashable) -> bool:
+        """Drop the estimates for `key`.
+
+        Returns
+        -------
+        bool
+            `True` if the key had estimates.
+        """
+        with self._lock:
+            return self._estimates.pop(key, None) is not None
+
+    def load(self, path: Optional[str] = None):
+        """Replace the estimates with those saved in a JSON file.
+        Keys are restored as strings.
+
+        Parameters
+        ----------
+        path: str, optional
+            File to read.
+            Default of `None` means `self.path`.
+        """
+        with open(path or self.path) as f:
+            estimates = json.load(f)
+        with self._lock:
+            self._estimates = OrderedDict(
+                (key, [float(mean), float(dev)])
+                for key, (mean, dev) in estimates.items()
+            )
+            while len(self._estimates) > self.max_keys:
+                self._estimates.popitem(last=False)
+
+    def save(self, path: Optional[str] = None):
+        """Write the estimates to a JSON file, atomically.
+        Keys are saved as strings.
+
+        Parameters
+        ----------
+        path: str, optional
+            File to write.
+            Default of `None` means `self.path`.
+        """
+        path = path or self.path
+        with self._lock:
+            estimates = {str(key): e for key, e in self._estimates.items()}
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(estimates, f)
+        os.replace(tmp_path, path)
+
+
+class KeyedAdaptiveStep(PollHooks):
+    """Step function bound to one key of an `AdaptiveStep`.
+
+    Pass it as the poll `step_fun` to schedule attempts from the learned
+    estimate, and as the poll `hooks` to learn from successful polls.
+    """
+
+    def __init__(self, adaptive: AdaptiveStep, key: Hashable):
+        self.adaptive = adaptive
+        self.key = key
+
+    def __call__(self, attempt: int, **kwargs) -> float:
+        return self.adaptive.step(self.key, attempt)
+
+    def on_success(self, record: AttemptRecord):
+        self.adaptive.observe(self.key, record.elapsed)
@@ -0,0 +1,204 @@
+"""Poll many resources through one bulk status call.
+
+`poll_batch_iter` yields each key as soon as its response passes
+`check_success`, and `poll_batch` returns the results of all keys. Each
+attempt groups the pending keys into chunks of `batch_size`, and all keys
+share one step schedule.
+"""
+
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .hooks import PollHooks
+from .polling import _PollState, is_truthy
+from .schedule import Schedule
+from .stats import PollStats
+from .step import step_exponential_backoff
+
+
+def poll_batch_iter(
+    fun: Callable[[List[Hashable]], Mapping[Hashable, Any]],
+    keys: Iterable[Hashable],
+    batch_size: int = 100,
+    step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+    step_fun_kwargs: Optional[dict] = None,
+    timeout: float = 60,
+    max_attempts: Optional[int] = None,
+    check_success: Callable = is_truthy,
+    ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    lambda_context: Any = None,
+    lambda_margin: float = 0.5,
+    hooks: Optional[PollHooks] = None,
+    log: bool = True,
+    stats: Optional[PollStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Any] = time.sleep,
+) -> Iterator[Tuple[Hashable, Any]]:
+    """Poll many keys with a bulk status function, yielding each key and
+    its response in the attempt in which `check_success` accepts the
+    response.
+
+    Each attempt calls `fun` once per chunk of up to `batch_size` keys
+    that are still pending, so the number of calls scales with the number
+    of batches rather than with the number of keys. The completed keys
+    are yielded once all chunks of the attempt have been called, before
+    the next step. Keys leave the poll as they succeed, and one step
+    schedule is shared by all keys. If a call raises an exception in
+    `ignore_exceptions`, the keys of that chunk stay pending until the
+    next attempt. When a limit is reached, the same exceptions as `poll`
+    are raised; the keys not yielded by then are still pending.
+
+    Parameters
+    ----------
+    fun: Callable
+        Bulk status function called with a list of keys. It returns a
+        mapping of keys to responses; keys missing from the mapping stay
+        pending.
+
+    keys: Iterable[Hashable]
+        Keys to poll. Duplicates are polled once.
+
+    batch_size: int, optional
+        Maximum number of keys passed to one call of `fun`.
+        Default is `100`.
+
+    check_success: Callable, optional
+        A callback function that accepts the response for one key and
+        returns `True` once that key is done.
+        Default is `topshelfsoftware_polling.polling.is_truthy`.
+
+    See `topshelfsoftware_polling.polling.poll` for a description of the
+    other parameters. `hooks` and `stats` see one attempt per round of
+    calls, with the responses of all its calls merged into one mapping as
+    the response, and `stats.attempts` counts the calls of `fun`.
+
+    Returns
+    -------
+    Iterator[tuple[Hashable, Any]]
+        Each key and its successful response, in order of completion.
+
+    >>> for job_id, job in poll_batch_iter(
+    >>>     client.describe_jobs,
+    >>>     job_ids,
+    >>>     check_success=lambda job: job["status"] in ("DONE", "FAILED"),
+    >>> ):
+    >>>     print(f"{job_id}: {job['status']}")
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    pending = list(dict.fromkeys(keys))
+    if not pending:
+        return
+    state = _PollState(
+        fun,
+        step_fun=step_fun,
+        step_fun_kwargs=step_fun_kwargs,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        ignore_exceptions=ignore_exceptions,
+        lambda_context=lambda_context,
+        lambda_margin=lambda_margin,
+        hooks=hooks,
+        log=log,
+        stats=stats,
+        clock=clock,
+    )
+    while True:
+        state.begin_attempt()
+        # every chunk is called before any response is checked, so the
+        # timing of each call covers the call alone
+        responses = {}
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            try:
+                responses.update(fun(chunk))
+            except Exception as e:
+                if not state.on_exception(e):
+                    raise
+                continue
+            state.on_response(responses)
+        completed = [
+            (key, responses[key])
+            for key in pending
+            if key in responses and check_success(responses[key])
+        ]
+        done = {key for key, _ in completed}
+        pending = [key for key in pending if key not in done]
+        finished = state.on_result(responses, not pending)
+        # yielded outside the timed phases; the time the consumer takes
+        # still counts toward the deadline
+        yield from completed
+        if finished:
+            return
+
+        sleep(state.next_sleep())
+
+
+def poll_batch(
+    fun: Callable[[List[Hashable]], Mapping[Hashable, Any]],
+    keys: Iterable[Hashable],
+    batch_size: int = 100,
+    step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+    step_fun_kwargs: Optional[dict] = None,
+    timeout: float = 60,
+    max_attempts: Optional[int] = None,
+    check_success: Callable = is_truthy,
+    ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    lambda_context: Any = None,
+    lambda_margin: float = 0.5,
+    hooks: Optional[PollHooks] = None,
+    log: bool = True,
+    stats: Optional[PollStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Any] = time.sleep,
+) -> Dict[Hashable, Any]:
+    """Poll many keys with a bulk status function until every key
+    succeeds.
+
+    See `poll_batch_iter` for a description of the parameters; use it
+    instead to process the keys as they complete, or to keep the results
+    of the keys that completed before a limit was reached.
+
+    Returns
+    -------
+    dict
+        Successful response of each key.
+
+    >>> jobs = poll_batch(
+    >>>     client.describe_jobs,
+    >>>     job_ids,
+    >>>     check_success=lambda job: job["status"] == "DONE",
+    >>> )
+    """
+    return dict(
+        poll_batch_iter(
+            fun,
+            keys,
+            batch_size=batch_size,
+            step_fun=step_fun,
+            step_fun_kwargs=step_fun_kwargs,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            check_success=check_success,
+            ignore_exceptions=ignore_exceptions,
+            lambda_context=lambda_context,
+            lambda_margin=lambda_margin,
+            hooks=hooks,
+            log=log,
+            stats=stats,
+            clock=clock,
+            sleep=sleep,
+        )
+    )
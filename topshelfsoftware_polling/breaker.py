@@ -0,0 +1,218 @@
+"""Retry budget and circuit breaker shared by the polls of one downstream
+service, to keep retries from piling onto a degraded target.
+
+A `CircuitBreaker` makes polls fail fast with `PollCircuitOpen` after
+consecutive failures, and a `RetryBudget` token bucket stretches the retry
+steps once it is spent. Both expose their state with `to_dict()` for
+metrics.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail polls fast while their target keeps raising exceptions.
+
+    Every call of the target is recorded: a call that raises counts as a
+    failure, a call that returns counts as a success, whether or not the
+    poll's `check_success` accepts the response. After
+    `failure_threshold` consecutive failures the breaker opens and polls
+    raise `PollCircuitOpen` instead of calling the target. Once
+    `reset_timeout` seconds have passed, a single probe call is let
+    through (half-open); its success closes the breaker, its failure
+    opens it again.
+
+    Parameters
+    ----------
+    failure_threshold: int, optional
+        Consecutive failures that open the breaker.
+        Default is `5`.
+
+    reset_timeout: float, optional
+        Time (in sec) the breaker stays open before a probe call is allowed.
+        Default is `30`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds.
+        Default is `time.monotonic`.
+
+    >>> orders_breaker = CircuitBreaker(failure_threshold=10)
+    >>> poll(get_order, args=(order_id,), ignore_exceptions=(HTTPError,),
+    >>>      breaker=orders_breaker)
+    >>> metrics.gauge("orders.breaker", orders_breaker.to_dict())
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """`"closed"`, `"open"` or `"half_open"`."""
+        with self._lock:
+            return self._state
+
+    def retry_after(self) -> float:
+        """Time (in sec) until an open breaker allows a probe call."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return 0.0
+            return max(self._opened_at + self.reset_timeout - self.clock(), 0)
+
+    def allow(self) -> bool:
+        """Return `True` if the target may be called now."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            now = self.clock()
+            if now >= self._opened_at + self.reset_timeout:
+                # let one probe through; restart the timer so another
+                # probe is allowed if this one never reports back
+                self._state = STATE_HALF_OPEN
+                self._opened_at = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._state = STATE_CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if (
+                self._state == STATE_HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                if self._state != STATE_OPEN:
+                    self.opened += 1
+                self._state = STATE_OPEN
+                self._opened_at = self.clock()
+
+    def reset(self):
+        """Close the breaker and reset its counters."""
+        with self._lock:
+            self._state = STATE_CLOSED
+            self.failures = self.opened = self.rejected = 0
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state,
+                "failures": self.failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class RetryBudget:
+    """Token bucket limiting the rate of retries after failed calls.
+
+    Each retry that follows an exception takes one token; tokens are
+    refilled at `rate` per second up to `capacity`. When the bucket is
+    empty the retry is not dropped but delayed: the step before it is
+    stretched until a token is available, so polls sharing the budget
+    spread their retries out to `rate` per second. The poll still gives
+    up when the stretched step reaches its deadline.
+
+    Parameters
+    ----------
+    rate: float, optional
+        Tokens added per second.
+        Default is `1`.
+
+    capacity: float, optional
+        Maximum number of tokens, i.e. the burst of retries allowed.
+        Default is `10`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds.
+        Default is `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1,
+        capacity: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.retries = 0
+        self.delayed = 0
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens available now; negative while retries are queued."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take a token for one retry.
+
+        Parameters
+        ----------
+        max_wait: float, optional
+            Longest acceptable wait (in sec). If the token would not be
+            available in time, nothing is taken.
+            Default of `None` means no limit.
+
+        Returns
+        -------
+        float
+            Time (in sec) the retry must wait for its token, `0` if one
+            was available, or `None` if the wait would exceed `max_wait`.
+        """
+        with self._lock:
+            self._refill()
+            wait = max(1 - self._tokens, 0) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            self.retries += 1
+            if wait:
+                self.delayed += 1
+            return wait
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": self._tokens,
+                "retries": self.retries,
+                "delayed": self.delayed,
+            }
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
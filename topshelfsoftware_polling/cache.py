@@ -0,0 +1,117 @@
+"""Bounded cache of successful poll results.
+
+`ResultCache` combines a TTL with LRU eviction, supports explicit
+invalidation and counts hits and misses. Pass it as `poll(..., cache=...)`.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class ResultCache:
+    """Thread-safe LRU cache of poll results with a time-to-live.
+
+    Pass an instance as the `cache` argument of `poll` or `poll_async` to
+    return the result of an earlier successful poll of the same target
+    and arguments without calling the target again. Only successful
+    results are stored; a poll that raises leaves the cache unchanged.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of results kept. The least recently used result is
+        evicted when the cache is full.
+        Default is `128`.
+
+    ttl: float, optional
+        Time (in sec) a result stays valid after it is stored.
+        `None` means results never expire.
+        Default is `300`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds.
+        Default is `time.monotonic`.
+
+    >>> jobs = ResultCache(maxsize=1024, ttl=3600)
+    >>> job = poll(get_job, args=(job_id,), check_success=is_done, cache=jobs)
+    >>> jobs.invalidate(make_key(get_job, (job_id,)))
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key: (expires, value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Retrieve the result stored for `key`.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            `(True, result)` on a hit, `(False, None)` if there is no
+            valid result for `key`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        """Store `value` for `key`, evicting the least recently used result
+        if the cache is full."""
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove the result stored for `key`.
+
+        Returns
+        -------
+        bool
+            `True` if a result was removed.
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        """Remove all results and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _expired(self, entry: Tuple[Optional[float], Any]) -> bool:
+        expires = entry[0]
+        return expires is not None and self.clock() >= expires
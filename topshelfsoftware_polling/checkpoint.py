@@ -0,0 +1,229 @@
+"""Checkpoints that let a poll resume in a later process.
+
+When a poll outlives the process running it, e.g. an AWS Lambda invocation
+capped by `lambda_context`, the next invocation would start again from
+attempt 1 with the shortest step and a fresh deadline. Pass a store as the
+`checkpoint` argument of `poll` to save the progress of the poll after
+every attempt; a later poll with the same `checkpoint_key` resumes from
+the saved attempt, step and deadline. The checkpoint is deleted when the
+poll succeeds or gives up for good.
+
+>>> store = SQLiteCheckpointStore("/tmp/polls.db")
+>>> poll(
+>>>     get_export,
+>>>     args=(export_id,),
+>>>     timeout=3600,
+>>>     lambda_context=context,
+>>>     checkpoint=store,
+>>>     checkpoint_key=f"export-{export_id}",
+>>> )
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+# longest response summary kept in a checkpoint
+_SUMMARY_LENGTH = 200
+
+
+class Checkpoint:
+    """Saved progress of a poll.
+
+    Times are wall clock timestamps (in sec since the epoch) so that they
+    stay meaningful in another process.
+
+    Attributes
+    ----------
+    attempt: int
+        Number of attempts made.
+
+    deadline: float
+        Time at which the poll times out, or `None` without a time limit.
+
+    step: float
+        Delay (in sec) computed after the last attempt.
+
+    next_attempt: float
+        Time at which the next attempt is due.
+
+    response: str
+        Summary of the last response or exception, for troubleshooting.
+    """
+
+    __slots__ = ("attempt", "deadline", "step", "next_attempt", "response")
+
+    def __init__(
+        self,
+        attempt: int,
+        deadline: Optional[float],
+        step: float,
+        next_attempt: float,
+        response: Optional[str] = None,
+    ):
+        self.attempt = attempt
+        self.deadline = deadline
+        self.step = step
+        self.next_attempt = next_attempt
+        self.response = response
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_json()})"
+
+    def to_json(self) -> str:
+        """Compact JSON representation."""
+        return json.dumps(
+            {name: getattr(self, name) for name in self.__slots__},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "Checkpoint":
+        return cls(**json.loads(data))
+
+
+def summarize(value: object) -> Optional[str]:
+    """Short description of a response or exception for a checkpoint."""
+    if value is None:
+        return None
+    if isinstance(value, BaseException):
+        summary = f"{type(value).__name__}: {value}"
+    else:
+        summary = repr(value)
+    if len(summary) > _SUMMARY_LENGTH:
+        summary = summary[: _SUMMARY_LENGTH - 3] + "..."
+    return summary
+
+
+class CheckpointStore(ABC):
+    """Base class of checkpoint stores.
+
+    Subclasses implement `load`, `save` and `delete`, keyed by the
+    `checkpoint_key` of the poll.
+
+    Parameters
+    ----------
+    clock: Callable, optional
+        Wall clock returning seconds since the epoch, used to convert the
+        deadline and next attempt of a poll to timestamps.
+        Default is `time.time`.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Checkpoint]:
+        """Checkpoint saved for `key`, or `None`."""
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: Checkpoint):
+        """Save `checkpoint` for `key`, replacing any previous one."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Delete the checkpoint saved for `key`, if any."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Store keeping each checkpoint in a small JSON file of a directory.
+
+    Files are replaced atomically, so a process killed while saving leaves
+    the previous checkpoint intact.
+
+    Parameters
+    ----------
+    directory: str
+        Directory of the checkpoint files, created if needed, e.g. under
+        `/tmp` to survive between warm AWS Lambda invocations.
+
+    clock: Callable, optional
+        See `CheckpointStore`.
+    """
+
+    def __init__(self, directory: str, clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        try:
+            with open(self._path(key)) as f:
+                return Checkpoint.from_json(f.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, checkpoint: Checkpoint):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(checkpoint.to_json())
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> str:
+        # any key maps to a distinct, valid file name
+        name = base64.urlsafe_b64encode(key.encode()).decode()
+        return os.path.join(self.directory, f"{name}.json")
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Store keeping the checkpoints in one table of a SQLite database,
+    which can be shared by the threads and processes of one host.
+
+    Parameters
+    ----------
+    path: str
+        Database file, created if needed.
+
+    clock: Callable, optional
+        See `CheckpointStore`.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        import sqlite3
+
+        super().__init__(clock)
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS poll_checkpoints "
+            "(key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM poll_checkpoints WHERE key = ?", (key,)
+            ).fetchone()
+        return Checkpoint.from_json(row[0]) if row is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO poll_checkpoints VALUES (?, ?)",
+                (key, checkpoint.to_json()),
+            )
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM poll_checkpoints WHERE key = ?", (key,)
+            )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
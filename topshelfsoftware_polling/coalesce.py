@@ -0,0 +1,160 @@
+"""Single-flight coalescing of identical concurrent polls.
+
+Polls started with `coalesce=True`, or with a shared `coalesce_key`,
+share one sequence of target calls while each caller keeps its own
+deadline.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+
+from .exceptions import PollTimeLimitReached
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+def make_key(
+    fun: Callable, args: tuple = (), kwargs: Optional[dict] = None
+) -> Hashable:
+    """Build a key identifying a poll by its target function and arguments.
+
+    Raises
+    ------
+    TypeError
+        If any of the arguments is unhashable; pass an explicit key instead.
+    """
+    key = (fun, tuple(args), frozenset((kwargs or {}).items()))
+    try:
+        hash(key)
+    except TypeError as e:
+        raise TypeError(
+            f"Cannot build a poll key from unhashable arguments ({e}); "
+            f"pass an explicit key instead"
+        ) from None
+    return key
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight wait for the leader's result or exception instead
+    of running their own. Each waiter keeps its own time budget: it stops
+    waiting once its budget is spent, and if the leader gave up because
+    the leader's own (shorter) time limit was reached, a waiter with
+    budget left takes over as the new leader.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, "Future"] = {}
+
+    def __len__(self) -> int:
+        """Number of keys with a call in flight."""
+        with self._lock:
+            return len(self._flights)
+
+    def run(
+        self,
+        key: Hashable,
+        fun: Callable[[], Any],
+        remaining: Callable[[], Optional[float]] = lambda: None,
+        on_timeout: Callable[[], Exception] = PollTimeLimitReached,
+    ) -> Any:
+        """Call `fun` unless a call for `key` is already in flight, in which
+        case wait for its outcome.
+
+        Parameters
+        ----------
+        key: Hashable
+            Identifies calls that may be coalesced.
+
+        fun: Callable
+            Function to run if this caller becomes the leader.
+
+        remaining: Callable, optional
+            Returns the time (in sec) this caller may still wait, or `None`
+            for no limit.
+            Default means no limit.
+
+        on_timeout: Callable, optional
+            Returns the exception to raise when this caller's time runs out
+            while waiting.
+            Default is `PollTimeLimitReached`.
+
+        Returns
+        -------
+        Any
+            Return value of `fun`, possibly from another caller's call.
+        """
+        # deferred to keep the package import light
+        from concurrent.futures import Future
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = Future()
+            if leader:
+                return self._lead(key, flight, fun)
+
+            try:
+                # waits without raising the leader's exception, which is
+                # shared by all waiters
+                error = flight.exception(timeout=remaining())
+            except FutureTimeoutError:
+                raise on_timeout() from None
+            if error is None:
+                return flight.result()
+            if isinstance(error, PollTimeLimitReached):
+                wait = remaining()
+                if wait is None or wait > 0:
+                    # the leader's own time ran out; take over
+                    continue
+                raise on_timeout() from None
+            copied = _copy_exception(error)
+            if copied is error:
+                raise error
+            raise copied from error
+
+    def _lead(self, key: Hashable, flight: "Future", fun: Callable[[], Any]):
+        # the flight is removed before its outcome is set, so a waiter
+        # taking over never finds the finished flight again
+        try:
+            res = fun()
+        except BaseException as e:
+            self._land(key, flight)
+            flight.set_exception(e)
+            raise
+        self._land(key, flight)
+        flight.set_result(res)
+        return res
+
+    def _land(self, key: Hashable, flight: "Future"):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+def _copy_exception(e: BaseException) -> BaseException:
+    """Copy of an exception shared by several callers, so each raises its
+    own object with its own traceback. Returns `e` if it cannot be
+    copied."""
+    # deferred to keep the package import light
+    import copy
+
+    try:
+        return copy.copy(e)
+    except Exception:
+        return e
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Retrieve the process-wide `SingleFlight` used by coalesced polls."""
+    return _single_flight
@@ -1,5 +1,7 @@
 """Custom polling exceptions defined here."""
 
+from typing import Any
+
 
 class PollAttemptLimitReached(Exception):
     """Raise to indicate max poll attempts exceeded."""
@@ -11,3 +13,25 @@ class PollTimeLimitReached(Exception):
     """Raise to indicate max poll time exceeded."""
 
     ...
+
+
+class PollAttemptTimeout(Exception):
+    """Raise to indicate a single poll attempt exceeded its time limit."""
+
+    ...
+
+
+class PollCircuitOpen(Exception):
+    """Raise to indicate a poll failed fast because its circuit breaker is
+    open."""
+
+    ...
+
+
+class PollTerminalFailure(Exception):
+    """Raise to indicate the target reached a state in which the poll can
+    never succeed. The response that failed is available as `response`."""
+
+    def __init__(self, *args, response: Any = None):
+        super().__init__(*args)
+        self.response = response
@@ -0,0 +1,129 @@
+"""Hedged attempts for targets with heavy tail latency.
+
+With `poll(..., hedge=Hedge(...))`, a call that has not returned within a
+fixed delay, or a learned percentile of past latencies, is duplicated up
+to `max_hedges` times and the first response wins. Duplicates are counted
+in `PollStats.hedges`.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from .stats import _percentile
+
+
+class Hedge:
+    """Policy for issuing duplicate calls of a slow target.
+
+    Pass an instance as the `hedge` argument of `poll`. When a call of the
+    target has not returned within the hedge delay, the same call is made
+    again on the executor, up to `max_hedges` times per attempt, and the
+    first call to complete decides the attempt. The other calls are
+    abandoned: like calls abandoned by `attempt_timeout`, they keep their
+    worker thread until they return.
+
+    The delay is either fixed (`after`) or learned as a percentile of the
+    latencies of recent calls, so only the slowest calls are hedged. One
+    instance can be shared by the polls of the same target to learn from
+    all of them.
+
+    Parameters
+    ----------
+    after: float, optional
+        Hedge delay (in sec). With `percentile`, the delay used until
+        `min_samples` latencies were observed.
+        Default of `None` means no hedging until then.
+
+    percentile: float, optional
+        Percentile in [0, 100] of the recent call latencies used as the
+        hedge delay, e.g. `95` to hedge the slowest 5% of calls.
+        Default is `None`.
+
+    max_hedges: int, optional
+        Maximum number of duplicate calls per attempt.
+        Default is `1`.
+
+    window: int, optional
+        Number of recent latencies the percentile is computed from.
+        Default is `100`.
+
+    min_samples: int, optional
+        Number of latencies needed before the percentile is used.
+        Default is `10`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds, used to time the calls.
+        Default is `time.monotonic`.
+
+    >>> hedge = Hedge(percentile=95, after=1.0, max_hedges=2)
+    >>> poll(get_status, args=(job_id,), hedge=hedge, stats=PollStats())
+    >>> print(hedge.to_dict())
+    """
+
+    def __init__(
+        self,
+        after: Optional[float] = None,
+        percentile: Optional[float] = None,
+        max_hedges: int = 1,
+        window: int = 100,
+        min_samples: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if after is None and percentile is None:
+            raise ValueError("set after or percentile")
+        if max_hedges < 1:
+            raise ValueError("max_hedges must be at least 1")
+        self.after = after
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.min_samples = min_samples
+        self.clock = clock
+        self.hedges = 0
+        self.wins = 0
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+
+    def delay(self) -> Optional[float]:
+        """Time (in sec) a call may run before it is hedged, or `None` if
+        calls are not hedged yet."""
+        if self.percentile is not None:
+            with self._lock:
+                if len(self._latencies) >= self.min_samples:
+                    return _percentile(
+                        sorted(self._latencies), self.percentile
+                    )
+        return self.after
+
+    def observe(self, latency: float):
+        """Add the latency (in sec) of a completed call."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def timed(self, fun: Callable) -> Callable:
+        """Wrap `fun` so that the latency of each call is observed, whether
+        or not the call decides its attempt."""
+
+        def call(*args, **kwargs) -> Any:
+            start = self.clock()
+            try:
+                return fun(*args, **kwargs)
+            finally:
+                self.observe(self.clock() - start)
+
+        return call
+
+    def record(self, hedges: int, won: bool):
+        """Count the duplicate calls of an attempt and whether one of them
+        completed first."""
+        with self._lock:
+            self.hedges += hedges
+            self.wins += won
+
+    def to_dict(self) -> dict:
+        return {
+            "delay": self.delay(),
+            "hedges": self.hedges,
+            "wins": self.wins,
+        }
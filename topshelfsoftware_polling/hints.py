@@ -0,0 +1,148 @@
+"""Extract backoff hints sent by servers, for use as the `step_hint` of a
+poll.
+
+A step hint is called with the target's response, or with the exception
+it raised, and returns the delay (in sec) the server asked for, or `None`
+to keep the step computed by `step_fun`. A hinted delay replaces the next
+step, and one ending after the deadline stops the poll.
+
+`retry_after` reads the `Retry-After` (seconds or HTTP date),
+`RateLimit-Reset` or `X-RateLimit-Reset` header of a response, or of the
+`response` of an ignored exception. `field_hint` reads a delay or an ETA
+from a response field.
+
+>>> poll(
+>>>     requests.get,
+>>>     args=(status_url,),
+>>>     check_success=lambda r: r.status_code == 200,
+>>>     ignore_exceptions=(requests.HTTPError,),
+>>>     step_hint=retry_after,
+>>> )
+"""
+
+import math
+import time
+from typing import Any, Callable, Mapping, Optional
+
+# X-RateLimit-Reset values above this are epoch timestamps, not delays
+_EPOCH_THRESHOLD = 1e9
+
+
+def retry_after(
+    value: Any, clock: Callable[[], float] = time.time
+) -> Optional[float]:
+    """Delay (in sec) requested by the headers of an HTTP response.
+
+    The `Retry-After` header is used if present, as a number of seconds or
+    an HTTP date, then the `RateLimit-Reset` header (seconds until the
+    rate limit resets) and the `X-RateLimit-Reset` header (seconds, or an
+    epoch timestamp for large values).
+
+    Parameters
+    ----------
+    value: Any
+        Response with a `headers` mapping, as returned by `requests` or
+        `httpx`, a `dict` with a `"headers"` key, or an exception with a
+        `response` attribute holding such a response.
+
+    clock: Callable, optional
+        Wall clock returning seconds since the epoch, used for dates and
+        timestamps.
+        Default is `time.time`.
+
+    Returns
+    -------
+    float
+        Requested delay, never negative, or `None` without a usable header.
+    """
+    headers = _headers(value)
+    if not headers:
+        return None
+    delay = _header(headers, "Retry-After")
+    if delay is not None:
+        return _parse_retry_after(delay, clock)
+    for name in ("RateLimit-Reset", "X-RateLimit-Reset"):
+        delay = _parse_seconds(_header(headers, name))
+        if delay is not None:
+            if delay > _EPOCH_THRESHOLD:
+                delay -= clock()
+            return max(delay, 0.0)
+    return None
+
+
+def field_hint(
+    *path: str, clock: Optional[Callable[[], float]] = None
+) -> Callable[[Any], Optional[float]]:
+    """Build a step hint reading a delay from a field of the response.
+
+    Parameters
+    ----------
+    path: str
+        Keys leading to the field in nested mappings, e.g.
+        `("job", "eta_seconds")`.
+
+    clock: Callable, optional
+        Wall clock returning seconds since the epoch. If given, the field
+        holds the epoch timestamp at which to poll again, such as an
+        estimated completion time, rather than a delay.
+        Default is `None`.
+
+    >>> poll(get_job, args=(job_id,), step_hint=field_hint("eta_seconds"))
+    """
+
+    def hint(value: Any) -> Optional[float]:
+        for key in path:
+            if not isinstance(value, Mapping):
+                return None
+            value = value.get(key)
+        delay = _parse_seconds(value)
+        if delay is None:
+            return None
+        if clock is not None:
+            delay -= clock()
+        return max(delay, 0.0)
+
+    return hint
+
+
+def _headers(value: Any) -> Optional[Mapping]:
+    if isinstance(value, BaseException):
+        value = getattr(value, "response", None)
+    headers = getattr(value, "headers", None)
+    if headers is None and isinstance(value, Mapping):
+        headers = value.get("headers")
+    return headers if isinstance(headers, Mapping) else None
+
+
+def _header(headers: Mapping, name: str) -> Optional[str]:
+    """Header value by case-insensitive name."""
+    value = headers.get(name)
+    if value is not None:
+        return value
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _parse_seconds(value: Any) -> Optional[float]:
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if math.isfinite(seconds) else None
+
+
+def _parse_retry_after(
+    value: str, clock: Callable[[], float]
+) -> Optional[float]:
+    delay = _parse_seconds(value)
+    if delay is None:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - clock()
+        except (TypeError, ValueError):
+            return None
+    return max(delay, 0.0)
@@ -0,0 +1,87 @@
+"""Lifecycle hooks for observing a poll as it runs.
+
+`PollHooks` has `on_attempt`, `on_retry`, `on_exception`, `on_success` and
+`on_give_up` callbacks, each given a lightweight `AttemptRecord`.
+"""
+
+from typing import Any, Optional
+
+
+class AttemptRecord:
+    """Lightweight snapshot of a poll attempt passed to `PollHooks`.
+
+    Attributes
+    ----------
+    attempt: int
+        Attempt count, starting at `1`.
+
+    elapsed: float
+        Time (in sec) since the poll started.
+
+    step: float
+        Delay (in sec) computed for the next attempt.
+
+    response: Any
+        Return value of the target function, if it returned.
+
+    exception: Exception
+        Exception raised by the target function, or the limit exception
+        that ended the poll, if any.
+    """
+
+    __slots__ = ("attempt", "elapsed", "step", "response", "exception")
+
+    def __init__(
+        self,
+        attempt: int,
+        elapsed: float,
+        step: float,
+        response: Any = None,
+        exception: Optional[Exception] = None,
+    ):
+        self.attempt = attempt
+        self.elapsed = elapsed
+        self.step = step
+        self.response = response
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(attempt={self.attempt}, "
+            f"elapsed={self.elapsed:.3f}, step={self.step:.3f}, "
+            f"response={self.response!r}, exception={self.exception!r})"
+        )
+
+
+class PollHooks:
+    """Callbacks invoked at each stage of a poll.
+
+    Subclass and override the stages of interest; the default
+    implementations do nothing. Hooks run on the polling thread (or event
+    loop), so they should be quick. Exceptions raised by a hook propagate
+    out of the poll.
+
+    >>> class PrintProgress(PollHooks):
+    >>>     def on_retry(self, record):
+    >>>         print(f"attempt {record.attempt}: {record.response}")
+    >>>
+    >>> poll(get_job, args=(job_id,), hooks=PrintProgress())
+    """
+
+    def on_attempt(self, record: AttemptRecord):
+        """Called before the target function is called."""
+
+    def on_exception(self, record: AttemptRecord):
+        """Called when the target function raises an exception."""
+
+    def on_retry(self, record: AttemptRecord):
+        """Called when an attempt did not succeed and another attempt will
+        follow after `record.step` seconds."""
+
+    def on_success(self, record: AttemptRecord):
+        """Called when `check_success` accepts the target's response."""
+
+    def on_give_up(self, record: AttemptRecord):
+        """Called when the poll ends without success, either because a
+        limit was reached or because of an exception that is not ignored.
+        The exception is available as `record.exception`."""
@@ -1,15 +1,114 @@
-"""Poll for status."""
+"""Poll for status.
 
-import datetime
-import time
-from typing import Any, Callable, Optional, Tuple
+`poll` blocks, `poll_async` runs on an `asyncio` event loop and
+`poll_iter` yields the `AttemptRecord` of every attempt.
+
+- Long-poll mode (`long_poll_kwarg`) hands each attempt a server-side wait
+  capped by the remaining timeout.
+- `check_failure` ends a poll at once with `PollTerminalFailure`, carrying
+  the response, when the target reaches a hopeless state such as FAILED.
+- Conditional polling (`version_kwarg`, `get_version`) hands the target the
+  version (e.g. ETag) of the last response; a `NOT_MODIFIED` or
+  same-version response skips the checks, and `poll_until_changed` waits
+  for a new version.
 
-from topshelfsoftware_logging import get_logger
+Importing this module is cheap for Lambda cold starts: `asyncio`,
+`concurrent.futures` and the package logger are loaded on first use, and
+the logger falls back to the standard library `logging` when
+`topshelfsoftware_logging` is missing.
+"""
+
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .breaker import CircuitBreaker, RetryBudget
+from .cache import ResultCache
+from .coalesce import get_single_flight, make_key
+from .hedge import Hedge
+from .hooks import AttemptRecord, PollHooks
+from .ratelimit import RateLimiter
+from .schedule import Schedule
+from .stats import (
+    OUTCOME_ATTEMPT_LIMIT,
+    OUTCOME_CANCELLED,
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    OUTCOME_TERMINAL_FAILURE,
+    OUTCOME_TIME_LIMIT,
+    PollStats,
+    get_stats_aggregator,
+)
 from .step import step_exponential_backoff
-from .exceptions import PollAttemptLimitReached, PollTimeLimitReached
+from .wakeup import wake_sleep, wake_sleep_async
+from .exceptions import (
+    PollAttemptLimitReached,
+    PollAttemptTimeout,
+    PollCircuitOpen,
+    PollTerminalFailure,
+    PollTimeLimitReached,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+    import logging
+    from concurrent.futures import Executor
+
+    from .checkpoint import CheckpointStore
+
+# asyncio, concurrent.futures, logging and topshelfsoftware_logging are
+# imported on first use, so importing the package stays cheap on cold starts
+_logger: Optional["logging.Logger"] = None
+_logger_lock = threading.Lock()
+# levels of the `logging` module
+_INFO = 20
+_WARNING = 30
+
+# an attempt is never started with less time than this left before the
+# deadline, which would leave the target no usable timeout; the last sleep
+# is clamped to end this long before the deadline
+_MIN_ATTEMPT_BUDGET = 0.01
 
-logger = get_logger(__name__, stream=None)
+# threads are started on demand; the ceiling leaves room for attempts that
+# were abandoned but are still blocked in the target function
+_EXECUTOR_MAX_WORKERS = 32
+_executor: Optional["Executor"] = None
+_executor_lock = threading.Lock()
+
+
+def _get_logger() -> "logging.Logger":
+    """Package logger, created on first use. Falls back to a standard
+    library logger if `topshelfsoftware_logging` is not installed."""
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                try:
+                    from topshelfsoftware_logging import get_logger
+                except ImportError:
+                    import logging
+
+                    _logger = logging.getLogger(__name__)
+                else:
+                    _logger = get_logger(__name__, stream=None)
+    return _logger
+
+
+def __getattr__(name: str) -> Any:
+    # `logger` is created lazily, see `_get_logger`
+    if name == "logger":
+        return _get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def is_truthy(value: Any) -> bool:
@@ -17,16 +116,557 @@ def is_truthy(value: Any) -> bool:
     return bool(value)
 
 
+class _NotModified:
+    """Type of `NOT_MODIFIED`."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NOT_MODIFIED"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+# returned by a target function to report that the resource did not change
+# since the version it was passed, e.g. on an HTTP 304 response
+NOT_MODIFIED = _NotModified()
+
+
+class _PollState:
+    """Bookkeeping shared by the sync and async polling loops.
+
+    The loops only perform the I/O (calling the target and sleeping);
+    attempt counting, step calculation, limits, logging and hook dispatch
+    live here. Deadlines are measured with a monotonic `clock` (by default
+    `time.monotonic`) so they are immune to wall clock adjustments.
+    """
+
+    def __init__(
+        self,
+        fun: Callable,
+        kwargs: Optional[dict] = None,
+        step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+        step_fun_kwargs: Optional[dict] = None,
+        step_hint: Optional[Callable[[Any], Optional[float]]] = None,
+        timeout: Optional[float] = 60,
+        max_attempts: Optional[int] = None,
+        ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+        check_failure: Optional[Callable] = None,
+        remaining_kwarg: Optional[str] = None,
+        lambda_context: Any = None,
+        lambda_margin: float = 0.5,
+        attempt_timeout: Optional[float] = None,
+        hooks: Optional[PollHooks] = None,
+        log: bool = True,
+        stats: Optional[PollStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+        breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedge: Optional[Hedge] = None,
+        long_poll_kwarg: Optional[str] = None,
+        long_poll_wait: float = 20,
+        checkpoint: Optional["CheckpointStore"] = None,
+        checkpoint_key: Optional[str] = None,
+        version_kwarg: Optional[str] = None,
+        get_version: Optional[Callable[[Any], Any]] = None,
+        version: Any = None,
+    ):
+        self.fun = fun
+        self.kwargs = kwargs or dict()
+        self.step_fun = step_fun
+        # copied, since the attempt count is written into it
+        self.step_fun_kwargs = dict(step_fun_kwargs or {})
+        self._steps = (
+            step_fun.steps() if isinstance(step_fun, Schedule) else None
+        )
+        self.step_hint = step_hint
+        self._hinted = False
+        self.max_attempts = max_attempts
+        self.ignore_exceptions = ignore_exceptions or tuple()
+        if attempt_timeout is not None:
+            self.ignore_exceptions += (PollAttemptTimeout,)
+        self.check_failure = check_failure
+        self.remaining_kwarg = remaining_kwarg
+        self.long_poll_kwarg = long_poll_kwarg
+        self.long_poll_wait = long_poll_wait
+        self._call_time = 0.0
+        if version_kwarg is not None and get_version is None:
+            raise ValueError("get_version is required with version_kwarg")
+        self.version_kwarg = version_kwarg
+        self.get_version = get_version
+        self.version = version
+        self.attempt_timeout = attempt_timeout
+        self.hooks = hooks
+        self.log = log
+        self.breaker = breaker
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.hedge = hedge
+        self.lambda_margin = lambda_margin
+        self.budget = _time_budget(timeout, lambda_context, lambda_margin)
+        # reported when the poll gives up; unlike the budget, it is not
+        # reduced when a checkpointed poll resumes
+        self.time_limit = self.budget
+        self.clock = clock
+        self.start = clock()
+        self.end = (
+            self.start + self.budget if self.budget is not None else None
+        )
+        self._last_attempt = False
+        self.attempt = 0
+        self.step = 0.0
+        self.last_response = None
+        self.last_exception = None
+        self.stats = stats
+        if stats is not None:
+            if stats.name is None:
+                stats.name = getattr(fun, "__qualname__", repr(fun))
+            self._mark = self.start
+            self._sleep_requested = 0.0
+        self.checkpoint = checkpoint
+        self.checkpoint_key = checkpoint_key
+        self._resume_wait: Optional[float] = None
+        if checkpoint is not None:
+            self._load_checkpoint(timeout, lambda_context)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or `None` without one."""
+        if self.end is None:
+            return None
+        return max(self.end - self.clock(), 0.0)
+
+    def call_kwargs(self) -> dict:
+        """Target function kwargs for the current attempt."""
+        kwargs = self.kwargs
+        if self.remaining_kwarg is not None:
+            kwargs = {**kwargs, self.remaining_kwarg: self.remaining()}
+        if self.version_kwarg is not None:
+            kwargs = {**kwargs, self.version_kwarg: self.version}
+        if self.long_poll_kwarg is not None:
+            remaining = self.remaining()
+            wait = self.long_poll_wait
+            if remaining is not None and remaining < wait:
+                wait = remaining
+            kwargs = {**kwargs, self.long_poll_kwarg: wait}
+            self._call_started = self.clock()
+        return kwargs
+
+    def attempt_wait(self) -> Optional[float]:
+        """Time (in sec) to wait for the current attempt, or `None` to call
+        the target inline without a limit."""
+        if self.attempt_timeout is None:
+            return None
+        remaining = self.remaining()
+        if remaining is None:
+            return self.attempt_timeout
+        return min(self.attempt_timeout, remaining)
+
+    def record(self, **kwargs) -> AttemptRecord:
+        """Snapshot of the current attempt for the hooks."""
+        kwargs.setdefault("step", self.step)
+        kwargs.setdefault("response", self.last_response)
+        kwargs.setdefault("exception", self.last_exception)
+        return AttemptRecord(self.attempt, self.clock() - self.start, **kwargs)
+
+    def call_delay(self) -> float:
+        """Reserve a rate limiter token for the next attempt and return the
+        time (in sec) to wait for it, or for the attempt due when the poll
+        was checkpointed, before calling the target."""
+        wait = 0.0
+        if self._resume_wait is not None:
+            wait, self._resume_wait = self._resume_wait, None
+            remaining = self.remaining()
+            if remaining is not None:
+                if remaining <= 0:
+                    raise self._give_up(self._time_limit_error())
+                wait = min(wait, remaining)
+        if self.rate_limiter is not None:
+            # the token must leave time for the attempt before the deadline
+            max_wait = self.remaining()
+            if max_wait is not None:
+                max_wait -= _MIN_ATTEMPT_BUDGET
+            reserved = None
+            if max_wait is None or max_wait >= 0:
+                reserved = self.rate_limiter.reserve(max_wait=max_wait)
+            if reserved is None:
+                raise self._give_up(self._time_limit_error())
+            wait = max(wait, reserved)
+        if wait and self.stats is not None:
+            self._sleep_requested += wait
+        return wait
+
+    def begin_attempt(self):
+        """Advance the attempt counter and compute the following step."""
+        if self.stats is not None and (
+            self.attempt or self.rate_limiter is not None
+        ):
+            slept = self._lap()
+            self.stats.sleep_time += slept
+            self.stats.sleep_overshoot += max(slept - self._sleep_requested, 0)
+        if self.end is not None and self.clock() >= self.end:
+            # e.g. a Lambda invocation without time left for its margin
+            raise self._give_up(self._time_limit_error())
+        self.attempt += 1
+        if self._steps is not None:
+            self.step = next(self._steps)
+        else:
+            self.step_fun_kwargs["attempt"] = self.attempt
+            self.step = self.step_fun(**self.step_fun_kwargs)
+        self._hinted = False
+        if self.stats is not None:
+            self.stats.step_time += self._lap()
+        self.last_response = self.last_exception = None
+        if self.max_attempts and self.attempt > self.max_attempts:
+            raise self._give_up(self._attempt_limit_error())
+        if self.breaker is not None and not self.breaker.allow():
+            raise self._give_up(
+                PollCircuitOpen(
+                    f"Circuit breaker is open, next call allowed in "
+                    f"{self.breaker.retry_after():.2f} seconds"
+                )
+            )
+        if self.hooks is not None:
+            self.hooks.on_attempt(self.record())
+
+    def on_exception(self, e: Exception) -> bool:
+        """Return `True` if the exception is ignored and the target
+        should be retried."""
+        self._end_call()
+        self.last_exception = e
+        if self.breaker is not None:
+            self.breaker.record_failure()
+        if self.hooks is not None:
+            self.hooks.on_exception(self.record())
+        if not isinstance(e, self.ignore_exceptions):
+            self._give_up(e)
+            return False
+        self._apply_hint(e)
+        self._log(
+            _WARNING,
+            "Failed %s due to %s. Attempt %d / %s, "
+            "retrying in %.2f seconds. [%s]",
+            getattr(self.fun, "__name__", self.fun),
+            type(e).__name__,
+            self.attempt,
+            self.max_attempts,
+            self.step,
+            e,
+        )
+        return True
+
+    def on_response(self, res: Any):
+        """Record a value returned by the target function before it is
+        passed to `check_success`."""
+        self._end_call()
+        self.last_response = res
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def is_unchanged(self, res: Any) -> bool:
+        """Return `True` if a response is `NOT_MODIFIED` or has the same
+        version as the previous one, so it need not be checked again."""
+        if res is NOT_MODIFIED:
+            unchanged = True
+        elif self.get_version is None:
+            return False
+        else:
+            version = self.get_version(res)
+            unchanged = version is not None and version == self.version
+            self.version = version
+        if unchanged and self.stats is not None:
+            self.stats.unchanged += 1
+        return unchanged
+
+    def on_result(
+        self, res: Any, success: bool, failure: Optional[bool] = None
+    ) -> bool:
+        """Return `True` if the poll is complete.
+
+        Raises `PollTerminalFailure` if an unsuccessful response is
+        rejected by `check_failure`, or if `failure` is `True` when the
+        caller evaluated `check_failure` itself.
+        """
+        if not success and failure is None and self.check_failure:
+            failure = self.check_failure(res)
+        if self.stats is not None:
+            self.stats.check_time += self._lap()
+        if success:
+            self._finish(OUTCOME_SUCCESS)
+            if self.checkpoint is not None:
+                self.checkpoint.delete(self.checkpoint_key)
+            if self.hooks is not None:
+                self.hooks.on_success(self.record())
+            return True
+        if failure:
+            raise self._give_up(
+                PollTerminalFailure(
+                    f"Poll reached a terminal failure on attempt "
+                    f"{self.attempt}",
+                    response=res,
+                )
+            )
+        self._apply_hint(res)
+        self._log(
+            _INFO,
+            "Poll #%d response: %s, next poll in %.2f seconds",
+            self.attempt,
+            res,
+            self.step,
+        )
+        return False
+
+    def next_sleep(self) -> float:
+        """Check the limits and return the delay before the next attempt.
+
+        The delay is clamped so the final attempt is made just before the
+        deadline, with `_MIN_ATTEMPT_BUDGET` left, rather than a full step
+        past it. The poll gives up if no more than that is left already.
+        """
+        if self.max_attempts and self.attempt >= self.max_attempts:
+            raise self._give_up(self._attempt_limit_error())
+        remaining = self.remaining()
+        if remaining is not None and (
+            self._last_attempt or remaining <= _MIN_ATTEMPT_BUDGET
+        ):
+            raise self._give_up(self._time_limit_error())
+        delay = self.step
+        if self.long_poll_kwarg is not None and not self._hinted:
+            # the target already waited server-side for part of the step
+            delay = max(delay - self._call_time, 0.0)
+        if remaining is not None and delay >= remaining - _MIN_ATTEMPT_BUDGET:
+            if self._hinted:
+                # the server asked not to be called again before the deadline
+                raise self._give_up(self._time_limit_error())
+            delay = remaining - _MIN_ATTEMPT_BUDGET
+            self._last_attempt = True
+        if self.retry_budget is not None and self.last_exception is not None:
+            # taken last, so no token is spent on a retry that never happens
+            delay = max(delay, self._retry_budget_wait(remaining))
+        if self.hooks is not None:
+            self.hooks.on_retry(self.record(step=delay))
+        if self.stats is not None:
+            self._lap()
+            self._sleep_requested = delay
+        if self.checkpoint is not None:
+            self._save_checkpoint(delay)
+        return delay
+
+    def _retry_budget_wait(self, remaining: Optional[float]) -> float:
+        """Take a retry budget token and return the time (in sec) to wait
+        for it. Gives up if it would not be available before the deadline,
+        without taking it."""
+        max_wait = None
+        if remaining is not None:
+            max_wait = remaining - _MIN_ATTEMPT_BUDGET
+        wait = self.retry_budget.acquire(max_wait=max_wait)
+        if wait is None:
+            raise self._give_up(self._time_limit_error())
+        return wait
+
+    def _apply_hint(self, value: Any):
+        """Replace the step by the delay the step hint reads from a
+        response or an ignored exception, if any."""
+        if self.step_hint is None:
+            return
+        hint = self.step_hint(value)
+        if hint is not None:
+            self.step = max(float(hint), 0.0)
+            self._hinted = True
+
+    def on_hedges(self, hedges: int, won: bool):
+        """Record the duplicate calls made for the current attempt."""
+        self.hedge.record(hedges, won)
+        if self.stats is not None:
+            self.stats.hedges += hedges
+
+    def cancel(self):
+        """Record that the poll was abandoned by its caller."""
+        self._finish(OUTCOME_CANCELLED)
+
+    def _end_call(self):
+        if self.long_poll_kwarg is not None:
+            self._call_time = self.clock() - self._call_started
+        if self.stats is not None:
+            latency = self._lap()
+            self.stats.attempts += 1
+            self.stats.target_time += latency
+            self.stats.target_latencies.append(latency)
+
+    def _lap(self) -> float:
+        """Time since the previous phase boundary."""
+        now = self.clock()
+        elapsed, self._mark = now - self._mark, now
+        return elapsed
+
+    def _finish(self, outcome: str):
+        stats = self.stats
+        if stats is None:
+            return
+        stats.outcome = outcome
+        stats.total_time = self.clock() - self.start
+        if stats.aggregate:
+            get_stats_aggregator().record(stats)
+
+    def _give_up(self, e: Exception) -> Exception:
+        if isinstance(e, PollAttemptLimitReached):
+            self._finish(OUTCOME_ATTEMPT_LIMIT)
+        elif isinstance(e, PollTimeLimitReached):
+            self._finish(OUTCOME_TIME_LIMIT)
+        elif isinstance(e, PollTerminalFailure):
+            self._finish(OUTCOME_TERMINAL_FAILURE)
+        else:
+            self._finish(OUTCOME_ERROR)
+        if self.checkpoint is not None:
+            if self._resumable(e):
+                self._save_checkpoint(self.step)
+            else:
+                self.checkpoint.delete(self.checkpoint_key)
+        if self.hooks is not None:
+            self.hooks.on_give_up(self.record(exception=e))
+        return e
+
+    def _load_checkpoint(self, timeout: Optional[float], lambda_context: Any):
+        """Resume from the checkpoint saved by an earlier poll, or save
+        the deadline of a new poll."""
+        if self.checkpoint_key is None:
+            raise ValueError("checkpoint_key is required with checkpoint")
+        now = self.checkpoint.clock()
+        saved = self.checkpoint.load(self.checkpoint_key)
+        if saved is None:
+            self._deadline = now + timeout if timeout else None
+        else:
+            self.attempt = saved.attempt
+            self.step = saved.step
+            if self._steps is not None:
+                for _ in range(saved.attempt):
+                    next(self._steps)
+            self._resume_wait = max(saved.next_attempt - now, 0.0)
+            self._deadline = saved.deadline
+            if saved.deadline is not None:
+                # the original deadline, capped by the Lambda's own
+                left = max(saved.deadline - now, 0.0)
+                self.budget = (
+                    _time_budget(left, lambda_context, self.lambda_margin)
+                    if left
+                    else 0.0
+                )
+                self.end = self.start + self.budget
+        # whether the poll ends before its deadline, so a later one resumes
+        self._capped = self.budget is not None and (
+            self._deadline is None or self.budget < self._deadline - now
+        )
+        if saved is not None and not self._capped:
+            # the poll is bound by its original deadline
+            self.time_limit = timeout
+        if saved is None:
+            self._save_checkpoint(0.0)
+
+    def _save_checkpoint(self, step: float):
+        # imported on first use, see `_get_logger`
+        from .checkpoint import Checkpoint, summarize
+
+        last = self.last_exception
+        if last is None:
+            last = self.last_response
+        now = self.checkpoint.clock()
+        self.checkpoint.save(
+            self.checkpoint_key,
+            Checkpoint(
+                self.attempt, self._deadline, step, now + step, summarize(last)
+            ),
+        )
+
+    def _resumable(self, e: Exception) -> bool:
+        """Whether a later poll may resume after giving up with `e`: only
+        if the time limit was reached before the saved deadline, i.e. the
+        Lambda ran out of time, not the poll."""
+        return self._capped and isinstance(e, PollTimeLimitReached)
+
+    def _log(self, level: int, msg: str, *args):
+        """Log lazily: the message is only formatted if logging is enabled
+        for this poll and `level` is enabled on the logger."""
+        if not self.log:
+            return
+        logger = _get_logger()
+        if logger.isEnabledFor(level):
+            logger.log(level, msg, *args)
+
+    def _time_limit_error(self) -> PollTimeLimitReached:
+        return PollTimeLimitReached(
+            f"Poll was not successful in time limit "
+            f"({_format_seconds(self.time_limit)} seconds)"
+        )
+
+    def _attempt_limit_error(self) -> PollAttemptLimitReached:
+        return PollAttemptLimitReached(
+            f"Poll was not successful in attempt limit ({self.max_attempts})"
+        )
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration in fixed-point notation with up to 3 decimals,
+    e.g. `0.05` or `1000000`."""
+    return f"{seconds:.3f}".rstrip("0").rstrip(".")
+
+
+def _time_budget(
+    timeout: Optional[float], lambda_context: Any, lambda_margin: float = 0.0
+) -> Optional[float]:
+    """Length of the poll in seconds: `timeout`, capped at the remaining
+    execution time of an AWS Lambda invocation, less `lambda_margin`, if a
+    context is given."""
+    budget = timeout or None
+    if lambda_context is not None:
+        lambda_remaining = max(
+            lambda_context.get_remaining_time_in_millis() / 1000
+            - lambda_margin,
+            0.0,
+        )
+        if budget is None or lambda_remaining < budget:
+            budget = lambda_remaining
+    return budget
+
+
 def poll(
     fun: Callable,
     args: tuple = (),
     kwargs: Optional[dict] = None,
-    step_fun: Callable = step_exponential_backoff,
+    step_fun: Union[Callable, Schedule] = step_exponential_backoff,
     step_fun_kwargs: Optional[dict] = None,
     timeout: float = 60,
     max_attempts: Optional[int] = None,
     check_success: Callable = is_truthy,
     ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    *,
+    step_hint: Optional[Callable[[Any], Optional[float]]] = None,
+    check_failure: Optional[Callable] = None,
+    remaining_kwarg: Optional[str] = None,
+    long_poll_kwarg: Optional[str] = None,
+    long_poll_wait: float = 20,
+    lambda_context: Any = None,
+    lambda_margin: float = 0.5,
+    attempt_timeout: Optional[float] = None,
+    executor: Optional["Executor"] = None,
+    hedge: Optional[Hedge] = None,
+    hooks: Optional[PollHooks] = None,
+    log: bool = True,
+    stats: Optional[PollStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Any] = time.sleep,
+    wake: Any = None,
+    breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    checkpoint: Optional["CheckpointStore"] = None,
+    checkpoint_key: Optional[str] = None,
+    version_kwarg: Optional[str] = None,
+    get_version: Optional[Callable[[Any], Any]] = None,
+    coalesce: bool = False,
+    coalesce_key: Optional[Hashable] = None,
+    cache: Optional[ResultCache] = None,
+    cache_key: Optional[Hashable] = None,
 ) -> Any:
     """Poll a target function until a certain condition is met.
 
@@ -42,8 +682,10 @@ def poll(
         Target function kwargs.
         Default is `None`.
 
-    step_fun: Callable, optional
-        A callback function to compute the next step in seconds.
+    step_fun: Callable | Schedule, optional
+        A callback function to compute the next step in seconds, or a
+        `topshelfsoftware_polling.schedule.Schedule`, which yields the
+        steps directly and ignores `step_fun_kwargs`.
         See `topshelfsoftware_polling.step` for predefined step functions.
         Default is `topshelfsoftware_polling.step.step_constant`.
 
@@ -75,6 +717,205 @@ def poll(
         a retry will be performed on the target function.
         Default is `None`.
 
+    The parameters below are keyword-only.
+
+    step_hint: Callable, optional
+        A callback function that accepts an unsuccessful return value of
+        the target function, or an ignored exception, and returns the
+        delay (in sec) requested by the server, e.g. from a `Retry-After`
+        header, or `None`. A delay returned replaces the next step and
+        the retry budget still applies. If the delay ends after the
+        deadline, the poll gives up at once with `PollTimeLimitReached`
+        rather than calling the target too early.
+        See `topshelfsoftware_polling.hints` for predefined step hints.
+        Default is `None`.
+
+    check_failure: Callable, optional
+        A callback function that accepts a return value of the target
+        function rejected by `check_success`. It should return `True` if
+        the target reached a state in which it can never succeed, e.g. a
+        job that FAILED or was CANCELLED; the poll then stops at once with
+        `PollTerminalFailure`, whose `response` attribute holds the value.
+        Default is `None`.
+
+    remaining_kwarg: str, optional
+        If set, the time (in sec) left before the poll deadline is passed
+        to the target function as a kwarg of this name on every attempt,
+        e.g. `"timeout"` to bound an HTTP request by the poll budget.
+        `None` is passed if the poll has no deadline.
+        Default is `None`.
+
+    long_poll_kwarg: str, optional
+        Enables long polling for targets that can wait server-side for the
+        resource to change. On every attempt the target function receives
+        the time (in sec) it may wait as a kwarg of this name, e.g.
+        `"wait_time"`: `long_poll_wait`, capped at the time left before
+        the poll deadline. The time the target spent in the call is
+        deducted from the following step, so no client-side sleep follows
+        a call in which the server already waited a full step.
+        Default is `None`.
+
+    long_poll_wait: float, optional
+        Longest server-side wait (in sec) to request in long-poll mode.
+        Default is `20`.
+
+    lambda_context: LambdaContext, optional
+        AWS Lambda context object. If provided, the poll deadline is capped
+        at the remaining execution time reported by
+        `get_remaining_time_in_millis()`, less `lambda_margin`.
+        Default is `None`.
+
+    lambda_margin: float, optional
+        Time (in sec) kept free before the Lambda invocation times out, so
+        the handler can still catch `PollTimeLimitReached` and respond.
+        Default is `0.5`.
+
+    attempt_timeout: float, optional
+        Maximum time (in sec) to wait for a single call of the target
+        function. The call runs on `executor` and is abandoned if it does
+        not return within this limit or before the poll deadline,
+        whichever comes first. An abandoned attempt is retried like an
+        exception in `ignore_exceptions`. The abandoned call cannot be
+        interrupted and keeps its worker thread until it returns.
+        Default of `None` means calls are made inline without a limit.
+
+    executor: concurrent.futures.Executor, optional
+        Executor used to run the target function when `attempt_timeout` is
+        set. Default of `None` means a thread pool of up to 32 threads
+        shared by all polls.
+
+    hedge: Hedge, optional
+        Hedging policy for targets with heavy tail latency. A call that has
+        not returned within the hedge delay is duplicated on `executor`, up
+        to `max_hedges` times, and the first call to complete, with a
+        response or an exception, decides the attempt. Duplicate calls are
+        counted in `stats.hedges`.
+        See `topshelfsoftware_polling.hedge.Hedge`.
+        Default is `None`.
+
+    hooks: PollHooks, optional
+        Callbacks invoked with an `AttemptRecord` at each stage of the poll.
+        See `topshelfsoftware_polling.hooks.PollHooks`.
+        Default is `None`.
+
+    log: bool, optional
+        Log unsuccessful attempts. Messages are only formatted when their
+        level is enabled on the package logger; set to `False` to skip
+        logging entirely, e.g. for hot paths.
+        Default is `True`.
+
+    stats: PollStats, optional
+        Filled in with the attempt count, time spent in each phase of the
+        poll, target latencies and outcome. When the poll ends the stats
+        are added to the process-wide aggregator.
+        See `topshelfsoftware_polling.stats`.
+        Default is `None`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds, used for the deadline and stats.
+        Default is `time.monotonic`.
+
+    sleep: Callable, optional
+        Function called with the delay (in sec) between attempts.
+        Together with `clock`, allows running polls in virtual time, e.g.
+        in tests or simulations.
+        Default is `time.sleep`.
+
+    wake: threading.Event | threading.Condition | int, optional
+        Wake-up source that interrupts the sleep between attempts, so the
+        next attempt is made as soon as a notification says the target is
+        likely ready; the steps remain the fallback. Accepts an `Event`
+        (cleared on wake-up), a `Condition` or a readable file descriptor.
+        Replaces `sleep` between attempts; waits for `rate_limiter` or
+        for a resumed `checkpoint` are not interrupted.
+        See `topshelfsoftware_polling.wakeup.wake_sleep`.
+        Default is `None`.
+
+    breaker: CircuitBreaker, optional
+        Circuit breaker shared by the polls of one downstream service.
+        Every call of the target is reported to it, and while it is open
+        the poll raises `PollCircuitOpen` instead of calling the target.
+        See `topshelfsoftware_polling.breaker.CircuitBreaker`.
+        Default is `None`.
+
+    retry_budget: RetryBudget, optional
+        Token bucket shared by the polls of one downstream service. Each
+        retry after an exception takes a token, and the step is stretched
+        while none is available.
+        See `topshelfsoftware_polling.breaker.RetryBudget`.
+        Default is `None`.
+
+    rate_limiter: RateLimiter, optional
+        Token bucket shared by polls of a rate-limited API. Each call of
+        the target waits for a token; the wait counts toward `timeout`,
+        and `PollTimeLimitReached` is raised if no token is available
+        before the deadline.
+        See `topshelfsoftware_polling.ratelimit.get_rate_limiter`.
+        Default is `None`.
+
+    checkpoint: CheckpointStore, optional
+        Store the progress of the poll is saved to after every attempt,
+        so a poll that runs out of time before its own deadline, e.g.
+        because of `lambda_context`, or whose process dies, can be resumed
+        by a later poll with the same `checkpoint_key`. The later poll
+        continues from the saved attempt count and step, waits until the
+        saved next attempt is due and keeps the original deadline. The
+        checkpoint is deleted when the poll succeeds or gives up for good.
+        See `topshelfsoftware_polling.checkpoint`.
+        Default is `None`.
+
+    checkpoint_key: str, optional
+        Key identifying the poll in `checkpoint`; required with it.
+        Default is `None`.
+
+    version_kwarg: str, optional
+        Enables conditional polling. On every attempt the target function
+        receives, as a kwarg of this name, the version of the last
+        response as returned by `get_version`, e.g. an ETag to send in an
+        `If-None-Match` header, or `None` on the first attempt. If the
+        resource did not change, the target should return `NOT_MODIFIED`
+        without reading the response body; the attempt then counts as
+        unsuccessful without calling `check_success` or `check_failure`.
+        Requires `get_version`.
+        Default is `None`.
+
+    get_version: Callable, optional
+        A callback function that accepts a return value of the target
+        function and returns its version token, e.g. its ETag,
+        last-modified time or sequence number, or `None` if it has none.
+        A response with the same version as the previous response is not
+        checked again. Unchanged responses are counted in
+        `stats.unchanged`.
+        Default is `None`.
+
+    coalesce: bool, optional
+        Share one poll between identical concurrent calls. While a poll of
+        the same target function with the same `args` and `kwargs` is in
+        progress in another thread, wait for its outcome instead of
+        calling the target. The arguments must be hashable. Each caller
+        keeps its own deadline; if the running poll gives up on its time
+        limit while this caller still has time left, this caller resumes
+        polling in its place. `hooks` and `stats` only cover the attempts
+        made by this caller.
+        Default is `False`.
+
+    coalesce_key: Hashable, optional
+        Key identifying polls to coalesce, for targets with unhashable
+        arguments or polls that should be shared across different
+        arguments. Implies `coalesce=True`.
+        Default is `None`.
+
+    cache: ResultCache, optional
+        Cache of successful results. If it holds a result for this target
+        and its arguments, that result is returned without calling the
+        target; otherwise the result of a successful poll is stored in it.
+        See `topshelfsoftware_polling.cache.ResultCache`.
+        Default is `None`.
+
+    cache_key: Hashable, optional
+        Key under which the result is cached. Default of `None` means a key
+        built from `fun`, `args` and `kwargs`, which must be hashable.
+
     Returns
     -------
     Any
@@ -98,47 +939,567 @@ def poll(
     >>>     raise
     >>> print(f"Result: {res.json()}")
     """
-    kwargs = kwargs or dict()
-    step_fun_kwargs = step_fun_kwargs or dict()
-    end = (
-        datetime.datetime.now() + datetime.timedelta(seconds=timeout)
-        if timeout
-        else None
+    if cache is not None:
+        if cache_key is None:
+            cache_key = make_key(fun, args, kwargs)
+        hit, res = cache.lookup(cache_key)
+        if hit:
+            return res
+    step_sleep = wake_sleep(wake) if wake is not None else sleep
+    state = _PollState(
+        fun,
+        kwargs=kwargs,
+        step_fun=step_fun,
+        step_fun_kwargs=step_fun_kwargs,
+        step_hint=step_hint,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        ignore_exceptions=ignore_exceptions,
+        check_failure=check_failure,
+        remaining_kwarg=remaining_kwarg,
+        lambda_context=lambda_context,
+        lambda_margin=lambda_margin,
+        attempt_timeout=attempt_timeout,
+        hooks=hooks,
+        log=log,
+        stats=stats,
+        clock=clock,
+        breaker=breaker,
+        retry_budget=retry_budget,
+        rate_limiter=rate_limiter,
+        hedge=hedge,
+        long_poll_kwarg=long_poll_kwarg,
+        long_poll_wait=long_poll_wait,
+        checkpoint=checkpoint,
+        checkpoint_key=checkpoint_key,
+        version_kwarg=version_kwarg,
+        get_version=get_version,
     )
-    ignore_exceptions = ignore_exceptions or tuple()
-    attempt = 0
+    if coalesce or coalesce_key is not None:
+        if coalesce_key is None:
+            coalesce_key = make_key(fun, args, kwargs)
+        res = get_single_flight().run(
+            coalesce_key,
+            lambda: _poll(
+                state, fun, args, check_success, executor, sleep, step_sleep
+            ),
+            remaining=state.remaining,
+            on_timeout=lambda: state._give_up(state._time_limit_error()),
+        )
+    else:
+        res = _poll(
+            state, fun, args, check_success, executor, sleep, step_sleep
+        )
+    if cache is not None:
+        cache.put(cache_key, res)
+    return res
+
+
+def _poll(
+    state: _PollState,
+    fun: Callable,
+    args: tuple,
+    check_success: Callable,
+    executor: Optional["Executor"],
+    sleep: Callable[[float], Any],
+    step_sleep: Callable[[float], Any],
+) -> Any:
+    """Blocking polling loop. Waits for the rate limiter or a resumed
+    checkpoint use `sleep`, and the steps `step_sleep`, which may be cut
+    short by a wake-up source."""
     while True:
-        attempt += 1
-        step_fun_kwargs["attempt"] = attempt
-        step = step_fun(**step_fun_kwargs)
-        if max_attempts and attempt > max_attempts:
-            raise PollAttemptLimitReached(
-                f"Poll was not successful in attempt limit ({max_attempts})"
-            )
+        delay = state.call_delay()
+        if delay:
+            sleep(delay)
+        state.begin_attempt()
+        try:
+            res = _call(fun, args, state, executor)
+        except Exception as e:
+            if not state.on_exception(e):
+                raise
+        else:
+            state.on_response(res)
+            if _check(state, res, check_success):
+                return res
+
+        step_sleep(state.next_sleep())
 
+
+def _check(state: _PollState, res: Any, check_success: Callable) -> bool:
+    """Check a response unless it is unchanged; return `True` if the poll
+    is complete."""
+    if state.is_unchanged(res):
+        return state.on_result(res, False, False)
+    return state.on_result(res, check_success(res))
+
+
+def poll_iter(
+    fun: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+    step_fun_kwargs: Optional[dict] = None,
+    timeout: float = 60,
+    max_attempts: Optional[int] = None,
+    check_success: Callable = is_truthy,
+    ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    *,
+    step_hint: Optional[Callable[[Any], Optional[float]]] = None,
+    check_failure: Optional[Callable] = None,
+    remaining_kwarg: Optional[str] = None,
+    long_poll_kwarg: Optional[str] = None,
+    long_poll_wait: float = 20,
+    lambda_context: Any = None,
+    lambda_margin: float = 0.5,
+    attempt_timeout: Optional[float] = None,
+    executor: Optional["Executor"] = None,
+    hedge: Optional[Hedge] = None,
+    hooks: Optional[PollHooks] = None,
+    log: bool = True,
+    stats: Optional[PollStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Any] = time.sleep,
+    wake: Any = None,
+    breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    checkpoint: Optional["CheckpointStore"] = None,
+    checkpoint_key: Optional[str] = None,
+    version_kwarg: Optional[str] = None,
+    get_version: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[AttemptRecord]:
+    """Poll a target function, yielding the outcome of every attempt.
+
+    Behaves like `poll`, but instead of discarding unsuccessful responses
+    it yields an `AttemptRecord` after each attempt, holding the response
+    or the ignored exception. The generator stops after yielding the
+    record of the successful attempt, and raises the same exceptions as
+    `poll` when a limit is reached. The sleep before the next attempt
+    happens when the next record is requested, so records are delivered
+    as soon as they are available. Closing the generator, e.g. by breaking
+    out of the loop, cancels the poll; `stats` then records the outcome
+    `"cancelled"`.
+
+    See `topshelfsoftware_polling.polling.poll` for a description of
+    the parameters.
+
+    Returns
+    -------
+    Iterator[AttemptRecord]
+        Record of each attempt.
+
+    >>> for record in poll_iter(
+    >>>     client.get_export,
+    >>>     args=(export_id,),
+    >>>     check_success=lambda export: export["status"] == "DONE",
+    >>> ):
+    >>>     if record.response is not None:
+    >>>         progress_bar.update(record.response["percent_complete"])
+    """
+    step_sleep = wake_sleep(wake) if wake is not None else sleep
+    state = _PollState(
+        fun,
+        kwargs=kwargs,
+        step_fun=step_fun,
+        step_fun_kwargs=step_fun_kwargs,
+        step_hint=step_hint,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        ignore_exceptions=ignore_exceptions,
+        check_failure=check_failure,
+        remaining_kwarg=remaining_kwarg,
+        lambda_context=lambda_context,
+        lambda_margin=lambda_margin,
+        attempt_timeout=attempt_timeout,
+        hooks=hooks,
+        log=log,
+        stats=stats,
+        clock=clock,
+        breaker=breaker,
+        retry_budget=retry_budget,
+        rate_limiter=rate_limiter,
+        hedge=hedge,
+        long_poll_kwarg=long_poll_kwarg,
+        long_poll_wait=long_poll_wait,
+        checkpoint=checkpoint,
+        checkpoint_key=checkpoint_key,
+        version_kwarg=version_kwarg,
+        get_version=get_version,
+    )
+    while True:
+        delay = state.call_delay()
+        if delay:
+            sleep(delay)
+        state.begin_attempt()
+        done = False
         try:
-            res = fun(*args, **kwargs)
+            res = _call(fun, args, state, executor)
         except Exception as e:
-            if isinstance(e, ignore_exceptions):
-                logger.warning(
-                    f"Failed {fun.__name__} due to {type(e).__name__}. "
-                    f"Attempt {attempt} / {max_attempts}, "
-                    f"retrying in {step:.2f} seconds. [{e}]"
-                )
-            else:
+            if not state.on_exception(e):
                 raise
         else:
-            if check_success(res):
+            state.on_response(res)
+            done = _check(state, res, check_success)
+        try:
+            yield state.record()
+        except GeneratorExit:
+            if not done:
+                state.cancel()
+            raise
+        if done:
+            return
+
+        step_sleep(state.next_sleep())
+
+
+def poll_until_changed(
+    fun: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    since: Any = None,
+    get_version: Optional[Callable[[Any], Any]] = None,
+    version_kwarg: Optional[str] = None,
+    step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+    step_fun_kwargs: Optional[dict] = None,
+    timeout: float = 60,
+    max_attempts: Optional[int] = None,
+    ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    step_hint: Optional[Callable[[Any], Optional[float]]] = None,
+    lambda_context: Any = None,
+    lambda_margin: float = 0.5,
+    hooks: Optional[PollHooks] = None,
+    log: bool = True,
+    stats: Optional[PollStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Any] = time.sleep,
+) -> Any:
+    """Poll a target function until its value changes.
+
+    Returns the first response whose version differs from `since`.
+    Responses that are `NOT_MODIFIED` or have an unchanged version count
+    as unsuccessful attempts.
+
+    Parameters
+    ----------
+    since: Any, optional
+        Version to wait to change, e.g. the ETag of a copy held by the
+        caller. With `version_kwarg`, it is passed to the first call.
+        Default of `None` means the version of the first response.
+
+    get_version: Callable, optional
+        A callback function that accepts a return value of the target
+        function and returns its version.
+        Default of `None` means the return value itself.
+
+    See `topshelfsoftware_polling.polling.poll` for a description of
+    the other parameters.
+
+    Returns
+    -------
+    Any
+        First response with a new version.
+
+    >>> config = poll_until_changed(
+    >>>     client.get_config,
+    >>>     since=etag,
+    >>>     get_version=lambda res: res.headers.get("ETag"),
+    >>>     version_kwarg="etag",
+    >>>     timeout=300,
+    >>> )
+    """
+    if get_version is None:
+        get_version = _identity
+    state = _PollState(
+        fun,
+        kwargs=kwargs,
+        step_fun=step_fun,
+        step_fun_kwargs=step_fun_kwargs,
+        step_hint=step_hint,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        ignore_exceptions=ignore_exceptions,
+        lambda_context=lambda_context,
+        lambda_margin=lambda_margin,
+        hooks=hooks,
+        log=log,
+        stats=stats,
+        clock=clock,
+        version_kwarg=version_kwarg,
+        get_version=get_version,
+        version=since,
+    )
+
+    def changed(res: Any) -> bool:
+        # responses with the version of the previous one are filtered out
+        # by the poll state, so only the first response can be unchanged
+        nonlocal since
+        if since is None:
+            since = get_version(res)
+            return False
+        return True
+
+    return _poll(state, fun, args, changed, None, sleep, sleep)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+async def poll_async(
+    fun: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+    step_fun_kwargs: Optional[dict] = None,
+    timeout: float = 60,
+    max_attempts: Optional[int] = None,
+    check_success: Callable = is_truthy,
+    ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    *,
+    step_hint: Optional[Callable[[Any], Optional[float]]] = None,
+    check_failure: Optional[Callable] = None,
+    remaining_kwarg: Optional[str] = None,
+    long_poll_kwarg: Optional[str] = None,
+    long_poll_wait: float = 20,
+    lambda_context: Any = None,
+    lambda_margin: float = 0.5,
+    attempt_timeout: Optional[float] = None,
+    hooks: Optional[PollHooks] = None,
+    log: bool = True,
+    stats: Optional[PollStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Optional[Callable[[float], Awaitable]] = None,
+    wake: Optional["asyncio.Event"] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    checkpoint: Optional["CheckpointStore"] = None,
+    checkpoint_key: Optional[str] = None,
+    version_kwarg: Optional[str] = None,
+    get_version: Optional[Callable[[Any], Any]] = None,
+    cache: Optional[ResultCache] = None,
+    cache_key: Optional[Hashable] = None,
+) -> Any:
+    """Poll a target function from a coroutine until a certain condition
+    is met.
+
+    Behaves like `poll` but waits between attempts with `asyncio.sleep`
+    instead of blocking the thread, so many polls can share one event loop.
+    `fun`, `check_success` and `check_failure` may be coroutine functions
+    (or any callable returning an awaitable), in which case their results
+    are awaited.
+
+    See `topshelfsoftware_polling.polling.poll` for a description of
+    the parameters. With `attempt_timeout`, an awaitable returned by `fun`
+    is cancelled rather than abandoned when it runs too long. `sleep` must
+    return an awaitable; default of `None` means `asyncio.sleep`. `wake`
+    must be an `asyncio.Event`. Coalescing and hedging are not available;
+    a `cache` may be shared with blocking polls. A `checkpoint` store and
+    `step_hint` are called synchronously from the event loop.
+
+    Returns
+    -------
+    Any
+        Return value of target function.
+
+    >>> res = await poll_async(
+    >>>     client.get_job,
+    >>>     args=(job_id,),
+    >>>     check_success=lambda job: job["status"] == "DONE",
+    >>> )
+    """
+    if cache is not None:
+        if cache_key is None:
+            cache_key = make_key(fun, args, kwargs)
+        hit, res = cache.lookup(cache_key)
+        if hit:
+            return res
+    if sleep is None:
+        import asyncio
+
+        sleep = asyncio.sleep
+    step_sleep = wake_sleep_async(wake) if wake is not None else sleep
+    state = _PollState(
+        fun,
+        kwargs=kwargs,
+        step_fun=step_fun,
+        step_fun_kwargs=step_fun_kwargs,
+        step_hint=step_hint,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        ignore_exceptions=ignore_exceptions,
+        check_failure=check_failure,
+        remaining_kwarg=remaining_kwarg,
+        lambda_context=lambda_context,
+        lambda_margin=lambda_margin,
+        attempt_timeout=attempt_timeout,
+        hooks=hooks,
+        log=log,
+        stats=stats,
+        clock=clock,
+        breaker=breaker,
+        retry_budget=retry_budget,
+        rate_limiter=rate_limiter,
+        long_poll_kwarg=long_poll_kwarg,
+        long_poll_wait=long_poll_wait,
+        checkpoint=checkpoint,
+        checkpoint_key=checkpoint_key,
+        version_kwarg=version_kwarg,
+        get_version=get_version,
+    )
+    res = await _poll_async(state, fun, args, check_success, sleep, step_sleep)
+    if cache is not None:
+        cache.put(cache_key, res)
+    return res
+
+
+async def _poll_async(
+    state: _PollState,
+    fun: Callable,
+    args: tuple,
+    check_success: Callable,
+    sleep: Callable[[float], Awaitable],
+    step_sleep: Callable[[float], Awaitable],
+) -> Any:
+    """Async counterpart of `_poll`."""
+    while True:
+        delay = state.call_delay()
+        if delay:
+            await sleep(delay)
+        state.begin_attempt()
+        try:
+            res = await _call_async(fun, args, state)
+        except Exception as e:
+            if not state.on_exception(e):
+                raise
+        else:
+            state.on_response(res)
+            if await _check_async(state, res, check_success):
                 return res
-            else:
-                logger.info(
-                    f"Poll #{attempt} response: {res}, "
-                    f"next poll in {step:.2f} seconds"
+
+        await step_sleep(state.next_sleep())
+
+
+async def _check_async(
+    state: _PollState, res: Any, check_success: Callable
+) -> bool:
+    """Async counterpart of `_check` that awaits the checks."""
+    if state.is_unchanged(res):
+        return state.on_result(res, False, False)
+    success = await _maybe_await(check_success(res))
+    failure = None
+    if not success and state.check_failure:
+        failure = await _maybe_await(state.check_failure(res))
+    return state.on_result(res, success, failure)
+
+
+async def _maybe_await(value: Any) -> Any:
+    import inspect
+
+    return await value if inspect.isawaitable(value) else value
+
+
+def _get_executor() -> "Executor":
+    """Thread pool shared by polls that use `attempt_timeout`."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _executor = ThreadPoolExecutor(
+                    max_workers=_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="poll-attempt",
                 )
+    return _executor
+
+
+def _call(
+    fun: Callable,
+    args: tuple,
+    state: _PollState,
+    executor: Optional["Executor"],
+) -> Any:
+    """Call the target, abandoning it after the attempt wait."""
+    if state.hedge is not None:
+        return _call_hedged(fun, args, state, executor)
+    wait = state.attempt_wait()
+    if wait is None:
+        return fun(*args, **state.call_kwargs())
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+
+    future = (executor or _get_executor()).submit(
+        fun, *args, **state.call_kwargs()
+    )
+    try:
+        return future.result(timeout=wait)
+    except FutureTimeoutError:
+        future.cancel()
+        raise PollAttemptTimeout(
+            f"Poll attempt did not complete in {wait:.2f} seconds"
+        ) from None
 
-        if end is not None and datetime.datetime.now() >= end:
-            raise PollTimeLimitReached(
-                f"Poll was not successful in time limit ({timeout} seconds)"
+
+def _call_hedged(
+    fun: Callable,
+    args: tuple,
+    state: _PollState,
+    executor: Optional["Executor"],
+) -> Any:
+    """Call the target on the executor, duplicating the call whenever the
+    hedge delay passes without a response; the first call to complete
+    wins and the others are abandoned."""
+    from concurrent.futures import FIRST_COMPLETED, wait as wait_futures
+
+    hedge = state.hedge
+    call = hedge.timed(fun)
+    kwargs = state.call_kwargs()
+    pool = executor or _get_executor()
+    futures = [pool.submit(call, *args, **kwargs)]
+    done = set()
+    wait = state.attempt_wait()
+    end = time.monotonic() + wait if wait is not None else None
+    try:
+        while True:
+            timeout = None
+            if len(futures) <= hedge.max_hedges:
+                timeout = hedge.delay()
+            if end is not None:
+                left = max(end - time.monotonic(), 0.0)
+                timeout = left if timeout is None else min(timeout, left)
+            done, _ = wait_futures(
+                futures, timeout=timeout, return_when=FIRST_COMPLETED
             )
+            if done:
+                break
+            if end is not None and time.monotonic() >= end:
+                raise PollAttemptTimeout(
+                    f"Poll attempt did not complete in {wait:.2f} seconds"
+                )
+            futures.append(pool.submit(call, *args, **kwargs))
+    finally:
+        for future in futures:
+            future.cancel()
+        won = bool(done) and futures[0] not in done
+        state.on_hedges(len(futures) - 1, won)
+    # the earliest call among those completed
+    return next(f for f in futures if f in done).result()
+
+
+async def _call_async(fun: Callable, args: tuple, state: _PollState) -> Any:
+    """Await the target, cancelling it after the attempt wait."""
+    import asyncio
+    import inspect
 
-        time.sleep(step)
+    res = fun(*args, **state.call_kwargs())
+    wait = state.attempt_wait()
+    if not inspect.isawaitable(res):
+        return res
+    if wait is None:
+        return await res
+    try:
+        return await asyncio.wait_for(res, timeout=wait)
+    except asyncio.TimeoutError:
+        raise PollAttemptTimeout(
+            f"Poll attempt did not complete in {wait:.2f} seconds"
+        ) from None
@@ -0,0 +1,146 @@
+"""Token-bucket rate limiter shared by concurrent polls of one API.
+
+A `RateLimiter` is thread-safe and asyncio-compatible. `get_rate_limiter()`
+shares one limiter by name, so every `poll(..., rate_limiter=...)` against
+the same API draws from the same bucket.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class RateLimiter:
+    """Thread-safe token bucket capping the rate of target calls.
+
+    Tokens are added at `rate` per second up to `burst`, and each call of
+    the target takes one. Callers reserve their token up front and are
+    told how long to wait for it, so concurrent polls are served in the
+    order they asked and the limiter never holds a lock while waiting.
+    The same limiter can be used from threads and from asyncio event
+    loops.
+
+    Parameters
+    ----------
+    rate: float
+        Calls allowed per second.
+
+    burst: float, optional
+        Maximum number of calls allowed back to back after an idle period.
+        Default is `1`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds.
+        Default is `time.monotonic`.
+
+    >>> limiter = get_rate_limiter("orders-api", rate=10)
+    >>> poll(get_order, args=(order_id,), rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.calls = 0
+        self.wait_time = 0.0
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Reserve a token for one call.
+
+        Parameters
+        ----------
+        max_wait: float, optional
+            Longest acceptable wait (in sec). If the token would not be
+            available in time, nothing is reserved.
+            Default of `None` means no limit.
+
+        Returns
+        -------
+        float
+            Time (in sec) to wait before making the call, or `None` if the
+            wait would exceed `max_wait`.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            wait = max(1 - self._tokens, 0) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            self.calls += 1
+            self.wait_time += wait
+            return wait
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available.
+
+        Returns
+        -------
+        bool
+            `False` if no token is available within `timeout` seconds.
+        """
+        wait = self.reserve(max_wait=timeout)
+        if wait is None:
+            return False
+        if wait:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Wait on the event loop until a token is available.
+
+        Returns
+        -------
+        bool
+            `False` if no token is available within `timeout` seconds.
+        """
+        import asyncio
+
+        wait = self.reserve(max_wait=timeout)
+        if wait is None:
+            return False
+        if wait:
+            await asyncio.sleep(wait)
+        return True
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "calls": self.calls,
+                "wait_time": self.wait_time,
+            }
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, burst: float = 1) -> RateLimiter:
+    """Retrieve the process-wide `RateLimiter` registered under `name`,
+    creating it with `rate` and `burst` on first use.
+
+    Later calls with the same name return the same limiter; their `rate`
+    and `burst` are ignored.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(name)
+        if limiter is None:
+            limiter = _rate_limiters[name] = RateLimiter(rate, burst=burst)
+        return limiter
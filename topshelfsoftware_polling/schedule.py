@@ -0,0 +1,202 @@
+"""Composable step schedules.
+
+A schedule describes the whole sequence of steps of a poll instead of
+computing each step from the attempt count. Pass one as the `step_fun` of
+`topshelfsoftware_polling.polling.poll`: each poll draws its steps from a
+fresh iterator, so a schedule holds no per-poll state and can be shared by
+any number of concurrent polls.
+
+>>> fast_then_backoff = Constant(0.5).then(
+>>>     Exponential(base_interval=2).capped(10), after_seconds=2
+>>> )
+>>> fast_then_backoff.materialize(8)
+array('d', [0.5, 0.5, 0.5, 0.5, 2.0, 4.0, 8.0, 10.0])
+>>> poll(get_job, args=(job_id,), step_fun=FullJitter(fast_then_backoff))
+"""
+
+import itertools
+import random
+from abc import ABC, abstractmethod
+from array import array
+from typing import Iterator, Optional
+
+
+class Schedule(ABC):
+    """Base class of step schedules.
+
+    Subclasses implement `steps`, which must return a new, endless
+    iterator of steps (in sec) on every call.
+    """
+
+    @abstractmethod
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        """Iterate over the steps after attempt 1, 2, 3...
+
+        Parameters
+        ----------
+        rng: random.Random, optional
+            Random number generator used by jittered schedules.
+            Default of `None` means the `random` module.
+        """
+
+    def materialize(self, n: int, seed: Optional[int] = None) -> array:
+        """First `n` steps (in sec) as a compact array of doubles.
+
+        Parameters
+        ----------
+        n: int
+            Number of steps.
+
+        seed: int, optional
+            Seed for jittered schedules, to make the result reproducible.
+            Default is `None`.
+        """
+        rng = random.Random(seed) if seed is not None else None
+        return array("d", itertools.islice(self.steps(rng), n))
+
+    def capped(self, max_interval: float) -> "Capped":
+        """This schedule with every step limited to `max_interval`."""
+        return Capped(self, max_interval)
+
+    def then(
+        self,
+        schedule: "Schedule",
+        after_seconds: Optional[float] = None,
+        after_attempts: Optional[int] = None,
+    ) -> "Chain":
+        """This schedule followed by `schedule`, see `Chain`."""
+        return Chain(self, schedule, after_seconds, after_attempts)
+
+
+class Constant(Schedule):
+    """The same step after every attempt."""
+
+    def __init__(self, step: float):
+        self.step = step
+
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        return itertools.repeat(float(self.step))
+
+
+class Exponential(Schedule):
+    """Steps of `base_interval` * `backoff_rate`^(`attempt` - 1), limited
+    to `max_interval`; the schedule of `step_exponential_backoff` without
+    jitter."""
+
+    def __init__(
+        self,
+        base_interval: float = 1,
+        backoff_rate: float = 2,
+        max_interval: float = 60,
+    ):
+        self.base_interval = base_interval
+        self.backoff_rate = backoff_rate
+        self.max_interval = max_interval
+
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        step = float(self.base_interval)
+        while step < self.max_interval:
+            yield step
+            step *= self.backoff_rate
+        yield from itertools.repeat(float(self.max_interval))
+
+
+class FullJitter(Schedule):
+    """Each step of `schedule` replaced by a random step in [0, step].
+
+    See https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter
+    """
+
+    def __init__(self, schedule: Schedule):
+        self.schedule = schedule
+
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        uniform = (rng or random).uniform
+        for step in self.schedule.steps(rng):
+            yield uniform(0, step)
+
+
+class DecorrelatedJitter(Schedule):
+    """Random steps between `base_interval` and three times the previous
+    step, limited to `max_interval`.
+
+    See https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter
+    """
+
+    def __init__(self, base_interval: float = 1, max_interval: float = 60):
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        uniform = (rng or random).uniform
+        step = self.base_interval
+        while True:
+            step = min(
+                self.max_interval, uniform(self.base_interval, step * 3)
+            )
+            yield step
+
+
+class Capped(Schedule):
+    """Steps of `schedule` limited to `max_interval`."""
+
+    def __init__(self, schedule: Schedule, max_interval: float):
+        self.schedule = schedule
+        self.max_interval = max_interval
+
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        max_interval = self.max_interval
+        for step in self.schedule.steps(rng):
+            yield min(step, max_interval)
+
+
+class Chain(Schedule):
+    """Steps of `first` until a switch-over point, then steps of `second`.
+
+    The switch happens once the steps taken from `first` add up to
+    `after_seconds`, or once `after_attempts` steps were taken from it,
+    whichever comes first. Time spent in the target is not counted, so
+    `after_seconds` is a lower bound on the time spent in `first`.
+
+    Parameters
+    ----------
+    first: Schedule
+        Schedule used first.
+
+    second: Schedule
+        Schedule used after the switch.
+
+    after_seconds: float, optional
+        Total of the steps after which to switch.
+        Default is `None`.
+
+    after_attempts: int, optional
+        Number of steps after which to switch.
+        Default is `None`.
+    """
+
+    def __init__(
+        self,
+        first: Schedule,
+        second: Schedule,
+        after_seconds: Optional[float] = None,
+        after_attempts: Optional[int] = None,
+    ):
+        if after_seconds is None and after_attempts is None:
+            raise ValueError("set after_seconds or after_attempts")
+        self.first = first
+        self.second = second
+        self.after_seconds = after_seconds
+        self.after_attempts = after_attempts
+
+    def steps(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        total = 0.0
+        first = self.first.steps(rng)
+        if self.after_attempts is not None:
+            first = itertools.islice(first, self.after_attempts)
+        for step in first:
+            yield step
+            total += step
+            if self.after_seconds is not None and total >= self.after_seconds:
+                break
+        yield from self.second.steps(rng)
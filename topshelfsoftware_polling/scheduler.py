@@ -0,0 +1,256 @@
+"""Multiplex many polls onto a single timer thread.
+
+`PollScheduler` runs thousands of concurrent polls with one timer thread
+and a small worker pool. Each submitted poll returns a
+`concurrent.futures.Future`.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .breaker import CircuitBreaker, RetryBudget
+from .hooks import PollHooks
+from .polling import _check, _PollState, is_truthy
+from .schedule import Schedule
+from .stats import PollStats
+from .step import step_exponential_backoff
+
+
+class _ScheduledPoll:
+    """A poll submitted to the scheduler and its pending future."""
+
+    __slots__ = ("fun", "args", "check_success", "state", "future")
+
+    def __init__(
+        self,
+        fun: Callable,
+        args: tuple,
+        check_success: Callable,
+        state: _PollState,
+    ):
+        self.fun = fun
+        self.args = args
+        self.check_success = check_success
+        self.state = state
+        self.future = Future()
+
+
+class PollScheduler:
+    """Run many concurrent polls without dedicating a thread to each one.
+
+    A single timer thread keeps every pending poll in a heap ordered by
+    the time its next attempt is due. When an attempt is due it is handed
+    to a small worker pool which calls the target function; the step
+    function then decides when the poll is due again. Waiting between
+    attempts therefore costs a heap entry rather than a blocked thread.
+
+    Parameters
+    ----------
+    max_workers: int, optional
+        Number of worker threads used to call target functions.
+        Default is `4`.
+
+    name: str, optional
+        Prefix for the names of the scheduler threads.
+        Default is `"PollScheduler"`.
+
+    >>> with PollScheduler(max_workers=8) as scheduler:
+    >>>     futures = [
+    >>>         scheduler.submit(get_job_status, args=(job_id,))
+    >>>         for job_id in job_ids
+    >>>     ]
+    >>>     results = [f.result() for f in futures]
+    """
+
+    def __init__(self, max_workers: int = 4, name: str = "PollScheduler"):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-worker"
+        )
+        self._heap: List[Tuple[float, int, _ScheduledPoll]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._shutdown = False
+        self._in_flight = 0
+        self._timer = threading.Thread(
+            target=self._run_timer, name=f"{name}-timer", daemon=True
+        )
+        self._timer.start()
+
+    def __enter__(self) -> "PollScheduler":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown(wait=True)
+
+    def __len__(self) -> int:
+        """Number of polls waiting for their next attempt."""
+        with self._cond:
+            return len(self._heap)
+
+    def submit(
+        self,
+        fun: Callable,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        step_fun: Union[Callable, Schedule] = step_exponential_backoff,
+        step_fun_kwargs: Optional[dict] = None,
+        timeout: float = 60,
+        max_attempts: Optional[int] = None,
+        check_success: Callable = is_truthy,
+        ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+        *,
+        step_hint: Optional[Callable[[Any], Optional[float]]] = None,
+        check_failure: Optional[Callable] = None,
+        remaining_kwarg: Optional[str] = None,
+        hooks: Optional[PollHooks] = None,
+        log: bool = True,
+        stats: Optional[PollStats] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        version_kwarg: Optional[str] = None,
+        get_version: Optional[Callable[[Any], Any]] = None,
+    ) -> Future:
+        """Schedule a poll of a target function.
+
+        Accepts a subset of the parameters of
+        `topshelfsoftware_polling.polling.poll`, with the same meaning.
+        The options that wait in the polling thread (`rate_limiter`,
+        `long_poll_kwarg`, `attempt_timeout`, `hedge`, `wake`) or that
+        persist or share a poll (`checkpoint`, `coalesce`, `cache`) are
+        not available, since attempts run on the shared workers and the
+        waits between them on the timer thread. The first attempt is made
+        as soon as a worker is available. Hooks are called on the worker
+        threads.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the return value of the target function, or to the
+            exception that ended the poll. The future can be cancelled at
+            any time before the poll completes; no further attempts are
+            made once it is cancelled.
+        """
+        state = _PollState(
+            fun,
+            kwargs=kwargs,
+            step_fun=step_fun,
+            step_fun_kwargs=step_fun_kwargs,
+            step_hint=step_hint,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            ignore_exceptions=ignore_exceptions,
+            check_failure=check_failure,
+            remaining_kwarg=remaining_kwarg,
+            hooks=hooks,
+            log=log,
+            stats=stats,
+            breaker=breaker,
+            retry_budget=retry_budget,
+            version_kwarg=version_kwarg,
+            get_version=get_version,
+        )
+        task = _ScheduledPoll(fun, args, check_success, state)
+        self._schedule(task, delay=0)
+        return task.future
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """Stop the scheduler.
+
+        Parameters
+        ----------
+        wait: bool, optional
+            Block until all submitted polls complete.
+            Default is `True`.
+
+        cancel_pending: bool, optional
+            Cancel the futures of polls that have not completed, instead of
+            letting them run to completion.
+            Default is `False`.
+        """
+        with self._cond:
+            if cancel_pending:
+                for _, _, task in self._heap:
+                    task.future.cancel()
+                self._heap.clear()
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            self._timer.join()
+            self._executor.shutdown(wait=True)
+
+    def _schedule(self, task: _ScheduledPoll, delay: float):
+        due = time.monotonic() + delay
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule polls after shutdown")
+            heapq.heappush(self._heap, (due, next(self._counter), task))
+            if self._heap[0][2] is task:
+                self._cond.notify()
+
+    def _run_timer(self):
+        with self._cond:
+            while True:
+                if not self._heap:
+                    if self._shutdown and not self._in_flight:
+                        break
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(timeout=delay)
+                    continue
+                _, _, task = heapq.heappop(self._heap)
+                if task.future.cancelled():
+                    continue
+                self._in_flight += 1
+                self._executor.submit(self._run_attempt, task)
+
+    def _run_attempt(self, task: _ScheduledPoll):
+        try:
+            delay = self._attempt(task)
+        except Exception as e:
+            _resolve(task.future, exception=e)
+            delay = None
+        with self._cond:
+            self._in_flight -= 1
+            if delay is not None and not task.future.done():
+                heapq.heappush(
+                    self._heap,
+                    (time.monotonic() + delay, next(self._counter), task),
+                )
+            self._cond.notify()
+
+    @staticmethod
+    def _attempt(task: _ScheduledPoll) -> Optional[float]:
+        """Make one attempt; return the delay until the next one, or `None`
+        if the poll is complete."""
+        state = task.state
+        state.begin_attempt()
+        try:
+            res = task.fun(*task.args, **state.call_kwargs())
+        except Exception as e:
+            if not state.on_exception(e):
+                raise
+        else:
+            state.on_response(res)
+            if _check(state, res, task.check_success):
+                _resolve(task.future, result=res)
+                return None
+        return state.next_sleep()
+
+
+def _resolve(
+    future: Future, result: Any = None, exception: Optional[Exception] = None
+):
+    """Complete a future unless it was cancelled in the meantime."""
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
@@ -0,0 +1,212 @@
+"""Virtual-time simulation of a client population polling a backend.
+
+Polls are simulated as arrays against a "time-to-ready" distribution of
+the target, and the report gives the total calls, detection latency and
+peak call rate.
+
+Requires `numpy` (`pip install topshelfsoftware_polling[simulate]`).
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from .polling import _MIN_ATTEMPT_BUDGET
+from .step import step_exponential_backoff
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Summary of a simulated population of polls.
+
+    Attributes
+    ----------
+    clients: int
+        Number of simulated polls.
+
+    total_calls: int
+        Calls made to the target across all clients.
+
+    calls_per_client: float
+        Mean number of calls per client.
+
+    detected: int
+        Clients whose poll saw the target ready before giving up.
+
+    latency_mean, latency_p50, latency_p90, latency_p99, latency_max: float
+        Detection latency (in sec): time from the target becoming ready
+        to the attempt that saw it, over detected clients.
+
+    peak_calls_per_second: float
+        Highest call rate against the backend over any `bin_width` window.
+    """
+
+    clients: int
+    total_calls: int
+    calls_per_client: float
+    detected: int
+    latency_mean: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+    peak_calls_per_second: float
+
+
+def simulate(
+    ready_times: Sequence[float],
+    step_fun: Callable = step_exponential_backoff,
+    step_fun_kwargs: Optional[dict] = None,
+    timeout: Optional[float] = 60,
+    max_attempts: Optional[int] = None,
+    start_times: Optional[Sequence[float]] = None,
+    call_latency: float = 0.0,
+    bin_width: float = 1.0,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """Replay a population of polls in virtual time.
+
+    Each client starts polling at its start time and its target becomes
+    ready `ready_times[i]` seconds later. The loop follows the same rules
+    as `topshelfsoftware_polling.polling.poll`: the first attempt is
+    immediate, steps come from `step_fun`, the sleep before the last
+    attempt is clamped to just before the deadline, and the poll gives up
+    at `timeout` or `max_attempts`. All clients are advanced together one
+    attempt at a time with NumPy array operations, so populations of
+    millions of clients take seconds.
+
+    The step schedule is computed once per attempt and shared by all
+    clients. If `step_fun_kwargs` contains `jitter=True`, the schedule is
+    computed without jitter and each client draws its own step uniformly
+    from [0, step], as `step_exponential_backoff` does.
+
+    Parameters
+    ----------
+    ready_times: Sequence[float]
+        Time (in sec) from the start of each client's poll until its
+        target is ready, e.g. samples from a fitted distribution.
+
+    step_fun: Callable, optional
+        Step function, see `topshelfsoftware_polling.step`.
+        Default is `topshelfsoftware_polling.step.step_exponential_backoff`.
+
+    step_fun_kwargs: dict, optional
+        Step function kwargs.
+        Default is `None`.
+
+    timeout: float, optional
+        Length of each poll in seconds. `None` means no limit.
+        Default is `60`.
+
+    max_attempts: int, optional
+        Maximum number of calls per client. `None` means no limit.
+        Default is `None`.
+
+    start_times: Sequence[float], optional
+        Time (in sec) at which each client starts polling.
+        Default of `None` means all clients start at time `0`.
+
+    call_latency: float, optional
+        Duration (in sec) of each call of the target.
+        Default is `0.0`.
+
+    bin_width: float, optional
+        Width (in sec) of the windows used to find the peak call rate.
+        Default is `1.0`.
+
+    seed: int, optional
+        Seed for the jitter random number generator.
+        Default is `None`.
+
+    Returns
+    -------
+    SimulationResult
+        Aggregate calls, detection latency and peak load.
+
+    >>> rng = numpy.random.default_rng(0)
+    >>> result = simulate(
+    >>>     ready_times=rng.lognormal(mean=3, sigma=0.5, size=100_000),
+    >>>     step_fun_kwargs={"base_interval": 2, "jitter": True},
+    >>>     start_times=rng.uniform(0, 60, size=100_000),
+    >>> )
+    >>> print(result.peak_calls_per_second, result.latency_p90)
+    """
+    if np is None:
+        raise ImportError(
+            "simulate requires numpy; install it with "
+            "`pip install topshelfsoftware_polling[simulate]`"
+        )
+    ready = np.asarray(ready_times, dtype=float)
+    n = ready.size
+    start = (
+        np.zeros(n) if start_times is None else np.asarray(start_times, float)
+    )
+    step_fun_kwargs = dict(step_fun_kwargs or {})
+    step_fun_kwargs.pop("attempt", None)
+    jitter = bool(step_fun_kwargs.pop("jitter", False))
+    rng = np.random.default_rng(seed)
+
+    elapsed = np.zeros(n)  # time since each client's start of next call
+    active = np.arange(n)  # clients still polling
+    latency = np.full(n, np.nan)
+    final = np.zeros(n, dtype=bool)
+    calls = np.zeros(n, dtype=np.int64)
+    load = np.zeros(0, dtype=np.int64)
+    attempt = 0
+    while active.size:
+        attempt += 1
+        t = elapsed[active]
+        calls[active] += 1
+        bins = ((start[active] + t) // bin_width).astype(np.int64)
+        counts = np.bincount(bins)
+        if counts.size > load.size:
+            counts[: load.size] += load
+            load = counts
+        else:
+            load[: counts.size] += counts
+
+        seen = t >= ready[active]
+        latency[active[seen]] = t[seen] - ready[active[seen]]
+        active, t = active[~seen], t[~seen] + call_latency
+        if max_attempts and attempt >= max_attempts:
+            break
+
+        step = float(
+            step_fun(attempt=attempt, jitter=False, **step_fun_kwargs)
+            if jitter
+            else step_fun(attempt=attempt, **step_fun_kwargs)
+        )
+        steps = rng.uniform(0, step, active.size) if jitter else step
+        if timeout:
+            # the last attempt is made `_MIN_ATTEMPT_BUDGET` before the
+            # deadline, as in `poll`
+            last = timeout - _MIN_ATTEMPT_BUDGET
+            alive = (t < last) & ~final[active]
+            active, t = active[alive], t[alive]
+            if np.ndim(steps):
+                steps = steps[alive]
+            clamped = steps >= last - t
+            final[active] = clamped
+            steps = np.where(clamped, last - t, steps)
+        elapsed[active] = t + steps
+
+    found = latency[~np.isnan(latency)]
+    quantiles = (
+        np.percentile(found, [50, 90, 99]) if found.size else [np.nan] * 3
+    )
+    return SimulationResult(
+        clients=n,
+        total_calls=int(calls.sum()),
+        calls_per_client=float(calls.mean()) if n else 0.0,
+        detected=int(found.size),
+        latency_mean=float(found.mean()) if found.size else np.nan,
+        latency_p50=float(quantiles[0]),
+        latency_p90=float(quantiles[1]),
+        latency_p99=float(quantiles[2]),
+        latency_max=float(found.max()) if found.size else np.nan,
+        peak_calls_per_second=float(load.max()) / bin_width if n else 0.0,
+    )
@@ -0,0 +1,142 @@
+"""Low-latency polling of cheap local conditions.
+
+For conditions that are cheap to check and expected to change soon, such
+as a file appearing, a flag in shared memory or the state of a subprocess,
+the sleep granularity and per-attempt overhead of `poll` dominate the
+detection latency. `poll_spin` checks the condition in a lean loop that
+first busy-spins, then yields the processor, and only then falls back to
+escalating sleeps. The busy time is bounded by `spin_time` +
+`yield_time`; `benchmarks/bench_spin.py` compares the detection latency
+and CPU use against `poll`.
+"""
+
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from .exceptions import PollTimeLimitReached
+from .polling import is_truthy
+
+
+def poll_spin(
+    fun: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    check_success: Callable = is_truthy,
+    timeout: Optional[float] = 60,
+    ignore_exceptions: Optional[Tuple[Exception, ...]] = None,
+    spin_time: float = 0.0002,
+    yield_time: float = 0.002,
+    base_interval: float = 0.0001,
+    backoff_rate: float = 2,
+    max_interval: float = 0.05,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], Any] = time.sleep,
+) -> Any:
+    """Poll a cheap target function at high frequency, then back off.
+
+    The target is called back to back for `spin_time` seconds, then with a
+    zero-length sleep between calls, which lets other threads and
+    processes run, until `yield_time` more seconds have passed. After
+    that, the delay between calls starts at `base_interval` and grows by
+    `backoff_rate` up to `max_interval`.
+
+    CPU use is bounded: whatever the timeout, the poll keeps the processor
+    busy for at most `spin_time` + `yield_time` seconds (plus the duration
+    of one call), and afterwards sleeps at least `base_interval` between
+    calls, so the CPU share of a long poll falls to about the cost of one
+    call every `max_interval`.
+
+    Hooks, stats, logging and the other features of `poll` are left out to
+    keep the per-attempt overhead low.
+
+    Parameters
+    ----------
+    spin_time: float, optional
+        Time (in sec) spent calling the target without sleeping.
+        Default is `0.0002`.
+
+    yield_time: float, optional
+        Time (in sec), after `spin_time`, spent calling the target with a
+        zero-length sleep between calls.
+        Default is `0.002`.
+
+    base_interval: float, optional
+        First delay (in sec) after the spinning phases.
+        Default is `0.0001`.
+
+    backoff_rate: float, optional
+        Multiplier applied to the delay after each sleeping attempt, at
+        least `1`.
+        Default is `2`.
+
+    max_interval: float, optional
+        Maximum delay (in sec) between calls, at least `base_interval`.
+        Default is `0.05`.
+
+    clock: Callable, optional
+        Monotonic clock returning seconds.
+        Default is `time.perf_counter`, for its resolution.
+
+    See `topshelfsoftware_polling.polling.poll` for a description of the
+    other parameters.
+
+    Returns
+    -------
+    Any
+        Return value of target function.
+
+    >>> poll_spin(os.path.exists, args=(ready_file,), timeout=5)
+    """
+    _check_timing(
+        spin_time, yield_time, base_interval, backoff_rate, max_interval
+    )
+    kwargs = kwargs or dict()
+    ignore_exceptions = ignore_exceptions or tuple()
+    start = clock()
+    end = start + timeout if timeout else None
+    spin_end = start + spin_time
+    yield_end = spin_end + yield_time
+    delay = base_interval
+    while True:
+        try:
+            res = fun(*args, **kwargs)
+        except ignore_exceptions:
+            pass
+        else:
+            if check_success(res):
+                return res
+        now = clock()
+        if end is not None and now >= end:
+            raise PollTimeLimitReached(
+                f"Poll was not successful in time limit ({timeout} seconds)"
+            )
+        if now < spin_end:
+            continue
+        if now < yield_end:
+            sleep(0)
+            continue
+        if end is not None and end - now < delay:
+            sleep(end - now)
+        else:
+            sleep(delay)
+        delay = min(delay * backoff_rate, max_interval)
+
+
+def _check_timing(
+    spin_time: float,
+    yield_time: float,
+    base_interval: float,
+    backoff_rate: float,
+    max_interval: float,
+):
+    if spin_time < 0:
+        raise ValueError("spin_time must not be negative")
+    if yield_time < 0:
+        raise ValueError("yield_time must not be negative")
+    # a delay that shrinks to zero would let the poll spin indefinitely
+    if base_interval <= 0:
+        raise ValueError("base_interval must be positive")
+    if backoff_rate < 1:
+        raise ValueError("backoff_rate must be at least 1")
+    if max_interval < base_interval:
+        raise ValueError("max_interval must not be less than base_interval")
@@ -0,0 +1,287 @@
+"""Instrumentation for polls: per-poll timing and process-wide histograms.
+
+`PollStats` records the attempts, time per phase, target latency
+percentiles, sleep overshoot and outcome of one poll. The process-wide
+aggregator keeps fixed-bucket histograms per target name.
+"""
+
+import bisect
+import math
+import threading
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+# upper bounds (in sec) of the latency buckets; larger values overflow
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000,
+)  # fmt: skip
+
+# upper bounds of the attempt count buckets
+ATTEMPT_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50, 100)
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_ATTEMPT_LIMIT = "attempt_limit"
+OUTCOME_TIME_LIMIT = "time_limit"
+OUTCOME_ERROR = "error"
+OUTCOME_TERMINAL_FAILURE = "terminal_failure"
+OUTCOME_CANCELLED = "cancelled"
+
+
+class PollStats:
+    """Timing and outcome of a single poll.
+
+    Pass an instance as the `stats` argument of
+    `topshelfsoftware_polling.polling.poll`; it is filled in as the poll
+    runs and, once the poll ends, added to the process-wide
+    `StatsAggregator` under `name`.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name under which the poll is aggregated.
+        Default of `None` means the target function's qualified name.
+
+    aggregate: bool, optional
+        Add the stats to the process-wide aggregator when the poll ends.
+        Default is `True`.
+
+    Attributes
+    ----------
+    attempts: int
+        Number of times the target function was called.
+
+    outcome: str
+        One of `"success"`, `"attempt_limit"`, `"time_limit"`, `"error"`,
+        `"terminal_failure"` or `"cancelled"`, or `None` while the poll is
+        running.
+
+    total_time, target_time, check_time, step_time, sleep_time: float
+        Wall time (in sec) of the whole poll and of each of its phases:
+        waiting on the target function, `check_success`, `step_fun` and
+        sleeping between attempts.
+
+    sleep_overshoot: float
+        Total time (in sec) slept beyond the requested steps.
+
+    hedges: int
+        Number of duplicate calls of the target made by hedging; they are
+        not counted in `attempts`.
+
+    unchanged: int
+        Number of responses that were not checked because they were
+        `NOT_MODIFIED` or had the version of the previous response.
+
+    target_latencies: list[float]
+        Duration (in sec) of each call of the target function.
+
+    >>> stats = PollStats(name="export-job")
+    >>> poll(get_export, args=(job_id,), stats=stats)
+    >>> print(stats.attempts, stats.sleep_time, stats.percentile(90))
+    """
+
+    __slots__ = (
+        "name",
+        "aggregate",
+        "attempts",
+        "outcome",
+        "total_time",
+        "target_time",
+        "check_time",
+        "step_time",
+        "sleep_time",
+        "sleep_overshoot",
+        "hedges",
+        "unchanged",
+        "target_latencies",
+    )
+
+    def __init__(self, name: Optional[str] = None, aggregate: bool = True):
+        self.name = name
+        self.aggregate = aggregate
+        self.attempts = 0
+        self.outcome: Optional[str] = None
+        self.total_time = 0.0
+        self.target_time = 0.0
+        self.check_time = 0.0
+        self.step_time = 0.0
+        self.sleep_time = 0.0
+        self.sleep_overshoot = 0.0
+        self.hedges = 0
+        self.unchanged = 0
+        self.target_latencies: List[float] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, "
+            f"outcome={self.outcome!r}, attempts={self.attempts}, "
+            f"total_time={self.total_time:.3f})"
+        )
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Target latency (in sec) at percentile `q` in [0, 100], or `None`
+        if the target was never called."""
+        return _percentile(sorted(self.target_latencies), q)
+
+    def to_dict(self) -> dict:
+        """Plain `dict` representation, e.g. for structured logging."""
+        return {
+            "name": self.name,
+            "outcome": self.outcome,
+            "attempts": self.attempts,
+            "total_time": self.total_time,
+            "target_time": self.target_time,
+            "check_time": self.check_time,
+            "step_time": self.step_time,
+            "sleep_time": self.sleep_time,
+            "sleep_overshoot": self.sleep_overshoot,
+            "hedges": self.hedges,
+            "unchanged": self.unchanged,
+            "target_latency_p50": self.percentile(50),
+            "target_latency_p90": self.percentile(90),
+            "target_latency_p99": self.percentile(99),
+        }
+
+
+class Histogram:
+    """Fixed-bucket histogram with compact integer counters.
+
+    Parameters
+    ----------
+    bounds: Sequence[float]
+        Sorted upper bounds of the buckets. Values above the last bound are
+        counted in an extra overflow bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = array("Q", bytes(8 * (len(self.bounds) + 1)))
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        """Add a value to the histogram."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding percentile `q` in [0, 100].
+        Returns `math.inf` for the overflow bucket and `None` if empty."""
+        if not self.count:
+            return None
+        rank = max(math.ceil(q / 100 * self.count), 1)
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else math.inf
+        return math.inf
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(
+                zip([*map(str, self.bounds), "+inf"], self.counts)
+            ),
+        }
+
+
+class _TargetStats:
+    """Aggregated stats for one target name."""
+
+    __slots__ = (
+        "polls",
+        "outcomes",
+        "hedges",
+        "attempts",
+        "total_time",
+        "target_latency",
+        "sleep_overshoot",
+    )
+
+    def __init__(self):
+        self.polls = 0
+        self.outcomes: Dict[str, int] = {}
+        self.hedges = 0
+        self.attempts = Histogram(ATTEMPT_BUCKETS)
+        self.total_time = Histogram(LATENCY_BUCKETS)
+        self.target_latency = Histogram(LATENCY_BUCKETS)
+        self.sleep_overshoot = Histogram(LATENCY_BUCKETS)
+
+    def add(self, stats: PollStats):
+        self.polls += 1
+        self.outcomes[stats.outcome] = self.outcomes.get(stats.outcome, 0) + 1
+        self.hedges += stats.hedges
+        self.attempts.observe(stats.attempts)
+        self.total_time.observe(stats.total_time)
+        self.sleep_overshoot.observe(stats.sleep_overshoot)
+        for latency in stats.target_latencies:
+            self.target_latency.observe(latency)
+
+    def to_dict(self) -> dict:
+        return {
+            "polls": self.polls,
+            "outcomes": dict(self.outcomes),
+            "hedges": self.hedges,
+            "attempts": self.attempts.to_dict(),
+            "total_time": self.total_time.to_dict(),
+            "target_latency": self.target_latency.to_dict(),
+            "sleep_overshoot": self.sleep_overshoot.to_dict(),
+        }
+
+
+class StatsAggregator:
+    """Thread-safe collection of fixed-bucket histograms per target name.
+
+    Each name keeps a poll count, outcome counts and histograms of attempts
+    per poll, time to outcome, target latency and sleep overshoot, so
+    memory use does not grow with the number of polls recorded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._targets: Dict[str, _TargetStats] = {}
+
+    def record(self, stats: PollStats):
+        """Add the stats of a finished poll."""
+        with self._lock:
+            target = self._targets.get(stats.name)
+            if target is None:
+                target = self._targets[stats.name] = _TargetStats()
+            target.add(stats)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Aggregated stats as plain `dict`s, keyed by target name."""
+        with self._lock:
+            return {
+                name: target.to_dict()
+                for name, target in self._targets.items()
+            }
+
+    def reset(self):
+        """Discard all aggregated stats."""
+        with self._lock:
+            self._targets.clear()
+
+
+_aggregator = StatsAggregator()
+
+
+def get_stats_aggregator() -> StatsAggregator:
+    """Retrieve the process-wide `StatsAggregator`."""
+    return _aggregator
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted `values`."""
+    if not values:
+        return None
+    rank = max(math.ceil(q / 100 * len(values)), 1)
+    return values[rank - 1]
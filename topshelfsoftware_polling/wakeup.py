@@ -0,0 +1,118 @@
+"""Wake-up sources that cut the sleep between poll attempts short.
+
+Pass a source as the `wake` argument of `poll` or `poll_async` when a
+notification (a webhook, a queue message, a file appearing) can tell the
+poll that the target is likely ready. The poll then makes its next attempt
+as soon as the source is signalled, and the step schedule remains the
+fallback when no signal arrives.
+"""
+
+import os
+import select
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+def wake_sleep(source: Any) -> Callable[[float], bool]:
+    """Build a sleep function that returns early when `source` is signalled.
+
+    Parameters
+    ----------
+    source: threading.Event | threading.Condition | int | object with fileno
+        - `threading.Event`: set it to wake the poll. It is cleared on
+          wake-up, so each `set()` triggers one early attempt; a signal
+          sent while the target is being called is not lost.
+        - `threading.Condition`: call `notify()` or `notify_all()` to wake
+          the poll. Notifications sent while the poll is not sleeping are
+          lost.
+        - file descriptor, or object with a `fileno()` method, such as the
+          read end of a pipe: wakes the poll when it becomes readable. The
+          available bytes are read and discarded; at end of file the
+          descriptor is no longer watched.
+
+    Returns
+    -------
+    Callable
+        Function sleeping for up to the given time (in sec), returning
+        `True` if it was woken early.
+    """
+    if isinstance(source, threading.Event):
+        return _event_sleep(source)
+    if isinstance(source, threading.Condition):
+        return _condition_sleep(source)
+    if isinstance(source, int) or hasattr(source, "fileno"):
+        return _fd_sleep(
+            source if isinstance(source, int) else source.fileno()
+        )
+    raise TypeError(
+        f"Unsupported wake-up source {type(source).__name__}; expected "
+        f"threading.Event, threading.Condition or a file descriptor"
+    )
+
+
+def wake_sleep_async(
+    source: "asyncio.Event",
+) -> Callable[[float], Awaitable]:
+    """Build a coroutine sleep function that returns early when the
+    `asyncio.Event` `source` is set. The event is cleared on wake-up."""
+    import asyncio
+
+    if not isinstance(source, asyncio.Event):
+        raise TypeError(
+            f"Unsupported wake-up source {type(source).__name__}; expected "
+            f"asyncio.Event"
+        )
+
+    async def sleep(seconds: float) -> bool:
+        try:
+            await asyncio.wait_for(source.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return False
+        source.clear()
+        return True
+
+    return sleep
+
+
+def _event_sleep(event: threading.Event) -> Callable[[float], bool]:
+    def sleep(seconds: float) -> bool:
+        if not event.wait(timeout=seconds):
+            return False
+        event.clear()
+        return True
+
+    return sleep
+
+
+def _condition_sleep(cond: threading.Condition) -> Callable[[float], bool]:
+    def sleep(seconds: float) -> bool:
+        with cond:
+            return cond.wait(timeout=seconds)
+
+    return sleep
+
+
+def _fd_sleep(fd: int) -> Callable[[float], bool]:
+    eof = False
+
+    def sleep(seconds: float) -> bool:
+        nonlocal eof
+        if eof:
+            time.sleep(seconds)
+            return False
+        deadline = time.monotonic() + seconds
+        readable, _, _ = select.select([fd], [], [], seconds)
+        if not readable:
+            return False
+        if os.read(fd, 4096):
+            return True
+        # end of file: only the time-based steps remain
+        eof = True
+        time.sleep(max(deadline - time.monotonic(), 0))
+        return False
+
+    return sleep